@@ -2,7 +2,26 @@ import streamlit as st
 import random
 import time
 import plotly.graph_objects as go
-import math
+
+from flappy.client import render_client
+from flappy.engine import (
+    BIRD_SIZE, BIRD_X, GAME_HEIGHT, GAME_WIDTH, PIPE_GAP, PIPE_WIDTH, FlappyEngine
+)
+from flappy.leaderboard import Leaderboard
+from flappy.loop import FixedTimestepLoop
+from flappy.timing import STAGES, FrameTimer
+
+LEADERBOARD_PATH = "leaderboard.db"
+
+# Loop modes: server renders every frame, or server ticks and the client animates
+LOOP_MODES = {
+    'classic': "Classic (server renders every frame)",
+    'smooth': "Smooth (fixed-rate server ticks, 60 fps client animation)"
+}
+SYNC_SECONDS = 0.25  # How often smooth mode sends state to the client
+
+# Rerun only the game view in smooth mode where Streamlit supports fragments
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
 
 # Page configuration
 st.set_page_config(
@@ -11,102 +30,38 @@ st.set_page_config(
     layout="wide"
 )
 
-# Game constants
-BIRD_SIZE = 30
-PIPE_WIDTH = 80
-PIPE_GAP = 150
-PIPE_SPEED = 4
-GRAVITY = 1.2
-JUMP_STRENGTH = -15
-GAME_WIDTH = 800
-GAME_HEIGHT = 600
-BIRD_X = 150
-
 # Initialize game state
 if 'game_state' not in st.session_state:
     st.session_state.game_state = 'menu'
-if 'bird_y' not in st.session_state:
-    st.session_state.bird_y = GAME_HEIGHT // 2
-if 'bird_velocity' not in st.session_state:
-    st.session_state.bird_velocity = 0
-if 'pipes' not in st.session_state:
-    st.session_state.pipes = []
-if 'score' not in st.session_state:
-    st.session_state.score = 0
+if 'engine' not in st.session_state:
+    st.session_state.engine = FlappyEngine()
 if 'high_score' not in st.session_state:
     st.session_state.high_score = 0
-if 'frame_count' not in st.session_state:
-    st.session_state.frame_count = 0
+if 'loop_mode' not in st.session_state:
+    st.session_state.loop_mode = 'classic'
+if 'player_name' not in st.session_state:
+    st.session_state.player_name = "Player"
+if 'run_verified' not in st.session_state:
+    st.session_state.run_verified = False
+if 'frame_timer' not in st.session_state:
+    st.session_state.frame_timer = FrameTimer()
 
-def create_pipe(x_position):
-    """Create a new pipe with random gap position"""
-    gap_y = random.randint(150, GAME_HEIGHT - PIPE_GAP - 150)
-    return {
-        'x': x_position,
-        'gap_y': gap_y,
-        'passed': False
-    }
+@st.cache_resource
+def get_leaderboard():
+    """Open the shared leaderboard once per server"""
+    return Leaderboard(LEADERBOARD_PATH)
 
-def update_bird():
-    """Update bird position and velocity"""
-    st.session_state.bird_velocity += GRAVITY
-    st.session_state.bird_y += st.session_state.bird_velocity
-    
-    # Keep bird within bounds
-    if st.session_state.bird_y < BIRD_SIZE:
-        st.session_state.bird_y = BIRD_SIZE
-        st.session_state.game_state = 'game_over'
-    elif st.session_state.bird_y > GAME_HEIGHT - BIRD_SIZE - 50:  # Account for ground
-        st.session_state.bird_y = GAME_HEIGHT - BIRD_SIZE - 50
-        st.session_state.game_state = 'game_over'
-
-def bird_jump():
-    """Make the bird jump"""
-    st.session_state.bird_velocity = JUMP_STRENGTH
-
-def update_pipes():
-    """Update pipe positions and create new ones"""
-    # Move existing pipes
-    for pipe in st.session_state.pipes:
-        pipe['x'] -= PIPE_SPEED
-    
-    # Remove pipes that are off screen
-    st.session_state.pipes = [pipe for pipe in st.session_state.pipes if pipe['x'] > -PIPE_WIDTH]
-    
-    # Add new pipes
-    if not st.session_state.pipes or st.session_state.pipes[-1]['x'] < GAME_WIDTH - 250:
-        st.session_state.pipes.append(create_pipe(GAME_WIDTH))
-
-def check_collisions():
-    """Check for collisions with pipes"""
-    bird_left = BIRD_X - BIRD_SIZE//2
-    bird_right = BIRD_X + BIRD_SIZE//2
-    bird_top = st.session_state.bird_y - BIRD_SIZE//2
-    bird_bottom = st.session_state.bird_y + BIRD_SIZE//2
-    
-    for pipe in st.session_state.pipes:
-        pipe_left = pipe['x']
-        pipe_right = pipe['x'] + PIPE_WIDTH
-        
-        # Check if bird is horizontally aligned with pipe
-        if bird_right > pipe_left and bird_left < pipe_right:
-            # Check collision with top pipe
-            if bird_top < pipe['gap_y']:
-                st.session_state.game_state = 'game_over'
-                return
-            
-            # Check collision with bottom pipe
-            if bird_bottom > pipe['gap_y'] + PIPE_GAP:
-                st.session_state.game_state = 'game_over'
-                return
-        
-        # Check if bird passed the pipe (for scoring)
-        if pipe['x'] + PIPE_WIDTH < BIRD_X and not pipe['passed']:
-            pipe['passed'] = True
-            st.session_state.score += 1
+# Trace order in the base figure; only these traces change between frames
+PIPE_TRACE = 0
+PIPE_CAP_TRACE = 1
+BIRD_BODY_TRACE = 2
+BIRD_EYE_TRACE = 3
+BIRD_PUPIL_TRACE = 4
+BIRD_BEAK_TRACE = 5
 
-def create_game_visual():
-    """Create the game visualization with a visible bird"""
+@st.cache_resource
+def create_base_figure():
+    """Build the static layers and empty dynamic traces once per server"""
     fig = go.Figure()
     
     # Add sky background
@@ -130,51 +85,31 @@ def create_game_visual():
             layer="below"
         )
     
-    # Add pipes with better visibility
-    for pipe in st.session_state.pipes:
-        # Top pipe
-        fig.add_shape(
-            type="rect",
-            x0=pipe['x'], y0=pipe['gap_y'],
-            x1=pipe['x'] + PIPE_WIDTH, y1=GAME_HEIGHT,
-            fillcolor="darkgreen",
-            line=dict(color="green", width=3)
-        )
-        
-        # Top pipe cap
-        fig.add_shape(
-            type="rect",
-            x0=pipe['x']-5, y0=pipe['gap_y']-20,
-            x1=pipe['x'] + PIPE_WIDTH+5, y1=pipe['gap_y'],
-            fillcolor="green",
-            line=dict(color="darkgreen", width=2)
-        )
-        
-        # Bottom pipe
-        fig.add_shape(
-            type="rect",
-            x0=pipe['x'], y0=0,
-            x1=pipe['x'] + PIPE_WIDTH, y1=pipe['gap_y'] - PIPE_GAP,
-            fillcolor="darkgreen",
-            line=dict(color="green", width=3)
-        )
-        
-        # Bottom pipe cap
-        fig.add_shape(
-            type="rect",
-            x0=pipe['x']-5, y0=pipe['gap_y'] - PIPE_GAP,
-            x1=pipe['x'] + PIPE_WIDTH+5, y1=pipe['gap_y'] - PIPE_GAP + 20,
-            fillcolor="green",
-            line=dict(color="darkgreen", width=2)
-        )
-    
-    # Add the bird - MAIN FIX: Proper bird visualization
-    bird_angle = max(-30, min(30, st.session_state.bird_velocity * 2))  # Tilt based on velocity
+    # Pipes: every pipe body in one filled trace, every cap in another
+    fig.add_trace(go.Scatter(
+        x=[], y=[],
+        mode='lines',
+        fill='toself',
+        fillcolor='darkgreen',
+        line=dict(color='green', width=3),
+        showlegend=False,
+        hoverinfo='skip',
+        name='Pipes'
+    ))
+    fig.add_trace(go.Scatter(
+        x=[], y=[],
+        mode='lines',
+        fill='toself',
+        fillcolor='green',
+        line=dict(color='darkgreen', width=2),
+        showlegend=False,
+        hoverinfo='skip',
+        name='Pipe Caps'
+    ))
     
     # Bird body (main circle)
     fig.add_trace(go.Scatter(
-        x=[BIRD_X],
-        y=[st.session_state.bird_y],
+        x=[BIRD_X], y=[],
         mode='markers',
         marker=dict(
             size=BIRD_SIZE,
@@ -189,8 +124,7 @@ def create_game_visual():
     
     # Bird eye
     fig.add_trace(go.Scatter(
-        x=[BIRD_X + 8],
-        y=[st.session_state.bird_y + 5],
+        x=[BIRD_X + 8], y=[],
         mode='markers',
         marker=dict(
             size=8,
@@ -205,8 +139,7 @@ def create_game_visual():
     
     # Bird pupil
     fig.add_trace(go.Scatter(
-        x=[BIRD_X + 10],
-        y=[st.session_state.bird_y + 5],
+        x=[BIRD_X + 10], y=[],
         mode='markers',
         marker=dict(
             size=4,
@@ -220,8 +153,7 @@ def create_game_visual():
     
     # Bird beak
     fig.add_trace(go.Scatter(
-        x=[BIRD_X + 15, BIRD_X + 25, BIRD_X + 15],
-        y=[st.session_state.bird_y, st.session_state.bird_y - 3, st.session_state.bird_y + 3],
+        x=[BIRD_X + 15, BIRD_X + 25, BIRD_X + 15], y=[],
         mode='lines',
         fill='toself',
         fillcolor='orange',
@@ -269,24 +201,152 @@ def create_game_visual():
         paper_bgcolor='skyblue',
         margin=dict(l=0, r=0, t=0, b=0),
         showlegend=False,
-        dragmode=False
+        dragmode=False,
+        uirevision='game'  # Keep the chart mounted between frames
     )
     
     return fig
 
+def get_game_figure():
+    """Get this session's figure, copied once from the cached base"""
+    if 'game_figure' not in st.session_state:
+        st.session_state.game_figure = go.Figure(create_base_figure())
+    return st.session_state.game_figure
+
+def add_rect(xs, ys, x0, y0, x1, y1):
+    """Append a closed rectangle to polygon coordinate lists"""
+    xs.extend((x0, x1, x1, x0, x0, None))
+    ys.extend((y0, y0, y1, y1, y0, None))
+
+def get_pipe_polygons(pipes):
+    """Get polygon coordinates for all (x, gap_y) pipe bodies and caps"""
+    body_x, body_y, cap_x, cap_y = [], [], [], []
+    for x, gap_y in pipes:
+
+        # Top pipe and cap
+        add_rect(body_x, body_y, x, gap_y, x + PIPE_WIDTH, GAME_HEIGHT)
+        add_rect(cap_x, cap_y, x - 5, gap_y - 20, x + PIPE_WIDTH + 5, gap_y)
+        
+        # Bottom pipe and cap
+        add_rect(body_x, body_y, x, 0, x + PIPE_WIDTH, gap_y - PIPE_GAP)
+        add_rect(cap_x, cap_y, x - 5, gap_y - PIPE_GAP, x + PIPE_WIDTH + 5, gap_y - PIPE_GAP + 20)
+    return body_x, body_y, cap_x, cap_y
+
+def create_game_visual():
+    """Update the session's game figure with the current bird and pipes"""
+    fig = get_game_figure()
+    engine = st.session_state.engine
+    body_x, body_y, cap_x, cap_y = get_pipe_polygons(engine.pipe_stream.ring)
+    bird_y = engine.bird_y
+    
+    # Only coordinates change; styling and static layers stay as built
+    with fig.batch_update():
+        fig.data[PIPE_TRACE].update(x=body_x, y=body_y)
+        fig.data[PIPE_CAP_TRACE].update(x=cap_x, y=cap_y)
+        fig.data[BIRD_BODY_TRACE].y = [bird_y]
+        fig.data[BIRD_EYE_TRACE].y = [bird_y + 5]
+        fig.data[BIRD_PUPIL_TRACE].y = [bird_y + 5]
+        fig.data[BIRD_BEAK_TRACE].y = [bird_y, bird_y - 3, bird_y + 3]
+    
+    return fig
+
 def reset_game():
     """Reset game to initial state"""
-    st.session_state.bird_y = GAME_HEIGHT // 2
-    st.session_state.bird_velocity = 0
-    st.session_state.pipes = []
-    st.session_state.score = 0
+    st.session_state.engine = FlappyEngine(seed=random.getrandbits(32))
+    st.session_state.game_loop = FixedTimestepLoop(st.session_state.engine)
     st.session_state.game_state = 'playing'
-    st.session_state.frame_count = 0
 
 def game_over():
-    """Handle game over state"""
-    if st.session_state.score > st.session_state.high_score:
-        st.session_state.high_score = st.session_state.score
+    """Handle game over state: verify the run by replay and record it"""
+    recording = st.session_state.engine.recording()
+    st.session_state.run_verified = get_leaderboard().submit(
+        st.session_state.player_name,
+        recording['seed'],
+        recording['flaps'],
+        recording['score']
+    )
+    
+    # Only replay-verified scores count towards the high score
+    if st.session_state.run_verified and recording['score'] > st.session_state.high_score:
+        st.session_state.high_score = recording['score']
+    st.session_state.game_state = 'game_over'
+
+def attach_frame_timer(engine):
+    """Give the engine the session's frame timer only while timing is enabled"""
+    frame_timer = st.session_state.frame_timer
+    engine.timer = frame_timer if frame_timer.enabled else None
+    return frame_timer
+
+def frame_timing_panel(frame_timer):
+    """Show the timing toggle and, while recording, percentiles, recent samples and export"""
+    frame_timer.enabled = st.checkbox("⏱️ Record frame timings", value=frame_timer.enabled)
+    if not frame_timer.enabled:
+        return
+    
+    summary = frame_timer.percentiles()
+    st.table([
+        {
+            'Stage': name,
+            'Samples': row['samples'],
+            'p50 (ms)': f"{row['p50']:.2f}" if row['samples'] else "-",
+            'p95 (ms)': f"{row['p95']:.2f}" if row['samples'] else "-",
+            'p99 (ms)': f"{row['p99']:.2f}" if row['samples'] else "-"
+        } for name, row in summary.items()
+    ])
+    
+    # Chart the most recent samples of every stage that has any
+    histories = {name: frame_timer.history(name) for name in STAGES}
+    histories = {name: values for name, values in histories.items() if values}
+    if histories:
+        length = min(len(values) for values in histories.values())
+        st.line_chart({name: values[-length:] for name, values in histories.items()})
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "📥 Download timings CSV",
+            data=frame_timer.to_csv(),
+            file_name="frame_timings.csv",
+            mime="text/csv"
+        )
+    with col2:
+        if st.button("🧹 Clear timings"):
+            frame_timer.reset()
+
+def smooth_game_view():
+    """Advance the fixed-timestep loop and send compact state to the client"""
+    game_loop = st.session_state.game_loop
+    engine = game_loop.engine
+    attach_frame_timer(engine)
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    
+    with col1:
+        if st.button("🐦 FLAP! (Make Bird Jump)", key="smooth_flap", type="primary", use_container_width=True):
+            game_loop.queue_flap()
+    
+    # Physics runs on wall-clock ticks, however often this view is rendered
+    game_loop.advance()
+    
+    with col2:
+        st.metric("📊 Score", engine.score)
+    
+    with col3:
+        st.metric("🏆 High Score", st.session_state.high_score)
+    
+    with col4:
+        if st.button("🔄 Reset Game", key="smooth_reset", use_container_width=True):
+            st.session_state.game_state = 'menu'
+            st.rerun()
+    
+    render_client(game_loop.snapshot(), game_loop.tick_seconds, SYNC_SECONDS)
+    
+    if engine.game_over:
+        game_over()
+        st.rerun()
+
+if fragment is not None:
+    smooth_game_view = fragment(run_every=SYNC_SECONDS)(smooth_game_view)
 
 # Main game title with bird emoji
 st.title("🐦 Flappy Bird Game - Now with Visible Bird!")
@@ -317,20 +377,45 @@ if st.session_state.game_state == 'menu':
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
+        st.session_state.player_name = st.text_input(
+            "🧑 Player name",
+            value=st.session_state.player_name,
+            max_chars=20
+        )
+        st.session_state.loop_mode = st.radio(
+            "🎞️ Loop mode",
+            options=list(LOOP_MODES),
+            format_func=LOOP_MODES.get,
+            index=list(LOOP_MODES).index(st.session_state.loop_mode)
+        )
         if st.button("🚀 START GAME", type="primary", use_container_width=True):
             reset_game()
             st.rerun()
 
+elif st.session_state.game_state == 'playing' and st.session_state.loop_mode == 'smooth':
+    smooth_game_view()
+    
+    st.markdown("💡 **Tip**: The bird and pipes animate in your browser between server updates, so the game stays smooth.")
+    
+    # Without fragments, rerun the whole page at the (slower) sync rate
+    if fragment is None:
+        time.sleep(SYNC_SECONDS)
+        st.rerun()
+
 elif st.session_state.game_state == 'playing':
+    engine = st.session_state.engine
+    frame_timer = attach_frame_timer(engine)
+    frame_timer.mark_frame()
+    
     # Game controls
     col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
     
     with col1:
         if st.button("🐦 FLAP! (Make Bird Jump)", type="primary", use_container_width=True):
-            bird_jump()
+            engine.flap()
     
     with col2:
-        st.metric("📊 Score", st.session_state.score)
+        st.metric("📊 Score", engine.score)
     
     with col3:
         st.metric("🏆 High Score", st.session_state.high_score)
@@ -341,23 +426,27 @@ elif st.session_state.game_state == 'playing':
             st.rerun()
     
     # Game status
-    st.info(f"🎮 **Game Active** - Bird Height: {int(st.session_state.bird_y)} | Velocity: {st.session_state.bird_velocity:.1f}")
+    st.info(f"🎮 **Game Active** - Bird Height: {int(engine.bird_y)} | Velocity: {engine.bird_velocity:.1f}")
     
-    # Update game logic
-    update_bird()
-    update_pipes()
-    check_collisions()
+    # Update game logic (one fixed timestep)
+    if not engine.step():
+        game_over()
     
     # Display game
-    fig = create_game_visual()
-    st.plotly_chart(fig, use_container_width=True, key=f"game_{st.session_state.frame_count}")
+    with frame_timer.stage('create_game_visual'):
+        fig = create_game_visual()
+    with frame_timer.stage('plotly_chart'):
+        st.plotly_chart(fig, use_container_width=True, key="game_view")
     
     # Game tips
     st.markdown("💡 **Tip**: Click FLAP to make the golden bird jump up! Watch it fall and time your clicks to pass through the green pipe gaps.")
     
     # Auto-refresh for continuous gameplay
     if st.session_state.game_state == 'playing':
-        st.session_state.frame_count += 1
+        # The rest of the page is skipped while playing, so the timing
+        # controls live here too (just the toggle while not recording)
+        with st.expander("⏱️ Frame timings", expanded=frame_timer.enabled):
+            frame_timing_panel(frame_timer)
         time.sleep(0.05)  # Faster refresh for smoother gameplay
         st.rerun()
 
@@ -366,14 +455,19 @@ elif st.session_state.game_state == 'game_over':
     
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("🎯 Final Score", st.session_state.score)
+        st.metric("🎯 Final Score", st.session_state.engine.score)
     with col2:
         st.metric("🏆 High Score", st.session_state.high_score)
     
-    if st.session_state.score == st.session_state.high_score and st.session_state.score > 0:
+    if st.session_state.engine.score == st.session_state.high_score and st.session_state.engine.score > 0:
         st.success("🏆 NEW HIGH SCORE! Congratulations!")
         st.balloons()
     
+    if st.session_state.run_verified:
+        st.caption("✅ Score verified by replay and added to the leaderboard")
+    else:
+        st.caption("⚠️ Score could not be verified by replay and was not recorded")
+    
     # Show final game state with crashed bird
     fig = create_game_visual()
     st.plotly_chart(fig, use_container_width=True)
@@ -391,13 +485,28 @@ elif st.session_state.game_state == 'game_over':
             st.session_state.game_state = 'menu'
             st.rerun()
 
+# Leaderboard of replay-verified scores (not queried during play)
+if st.session_state.game_state != 'playing':
+    with st.expander("🏅 Leaderboard"):
+        top_scores = get_leaderboard().top(10)
+        if top_scores:
+            st.table([
+                {'Rank': rank, 'Player': player, 'Score': score}
+                for rank, (player, score, created) in enumerate(top_scores, start=1)
+            ])
+        else:
+            st.write("No verified scores yet - be the first!")
+
 # Debug information
 with st.expander("🔧 Game Debug Info (Check if bird is working)"):
-    st.write(f"**Bird Position**: X={BIRD_X}, Y={st.session_state.bird_y}")
-    st.write(f"**Bird Velocity**: {st.session_state.bird_velocity}")
-    st.write(f"**Number of Pipes**: {len(st.session_state.pipes)}")
+    st.write(f"**Bird Position**: X={BIRD_X}, Y={st.session_state.engine.bird_y}")
+    st.write(f"**Bird Velocity**: {st.session_state.engine.bird_velocity}")
+    st.write(f"**Number of Pipes**: {len(st.session_state.engine.pipe_stream.ring)}")
     st.write(f"**Game State**: {st.session_state.game_state}")
-    st.write(f"**Frame Count**: {st.session_state.frame_count}")
+    st.write(f"**Frame Count**: {st.session_state.engine.frame}")
+    
+    # Per-stage frame timings (rolling window of recent frames)
+    frame_timing_panel(st.session_state.frame_timer)
 
 # Game instructions
 with st.expander("📖 Detailed Game Guide"):
@@ -0,0 +1,40 @@
+"""
+Import-time benchmark for the ludo package
+
+Runs ``import ludo`` in fresh interpreters and fails if the best time
+exceeds the budget. Usage: python benchmarks/import_time.py [budget_ms]
+"""
+
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 50
+RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Measured inside the child so interpreter startup is not counted
+SNIPPET = (
+    "import time; t = time.perf_counter(); import ludo; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+def measure_import_ms():
+    """Time a single cold ``import ludo`` in a new interpreter"""
+    output = subprocess.check_output([sys.executable, "-c", SNIPPET], cwd=ROOT)
+    return float(output.decode().strip())
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    timings = [measure_import_ms() for _ in range(RUNS)]
+    best = min(timings)
+
+    print(f"import ludo: best {best:.2f} ms over {RUNS} runs (budget {budget_ms:.0f} ms)")
+    if best > budget_ms:
+        print("FAIL: import time over budget")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
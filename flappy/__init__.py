@@ -0,0 +1,26 @@
+"""
+Flappy Bird Package
+
+Headless physics for the Streamlit Flappy Bird app. The NumPy batch
+simulator in flappy.batch is only imported on first access.
+"""
+
+import importlib
+
+from .engine import FlappyEngine, PipeRing, PipeStream
+
+__all__ = [
+    "FlappyEngine",
+    "PipeRing",
+    "PipeStream"
+]
+
+def __getattr__(name):
+    """Import the NumPy batch simulator on first access"""
+    if name == "batch":
+        # import_module, not "from . import batch", which would probe this
+        # module's attributes and re-enter __getattr__
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,88 @@
+"""
+Batch module - vectorized multi-bird Flappy Bird simulation
+
+BatchEngine advances thousands of birds in one NumPy step against a single
+shared, seeded PipeStream, for training and evaluating flap controllers.
+Each bird follows exactly the physics of FlappyEngine; dead birds stay
+frozen where they crashed.
+"""
+
+import numpy as np
+
+from .engine import (
+    BIRD_MAX_Y, BIRD_MIN_Y, BIRD_LEFT, BIRD_RIGHT, BIRD_SIZE, BIRD_X,
+    GAME_HEIGHT, GRAVITY, JUMP_STRENGTH, PIPE_GAP, PIPE_WIDTH, PipeStream
+)
+
+class BatchEngine:
+    def __init__(self, num_birds, seed=None):
+        self.num_birds = num_birds
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        """Reset every bird and the shared pipe stream"""
+        self.bird_y = np.full(self.num_birds, GAME_HEIGHT // 2, dtype=np.float64)
+        self.bird_velocity = np.zeros(self.num_birds, dtype=np.float64)
+        self.alive = np.ones(self.num_birds, dtype=bool)
+        self.score = np.zeros(self.num_birds, dtype=np.int64)
+        self.frames_alive = np.zeros(self.num_birds, dtype=np.int64)
+        self.pipe_stream = PipeStream(self.seed)
+        self.frame = 0
+
+    def observe(self):
+        """Get controller inputs: bird y, velocity, distance to and gap of the nearest pipe"""
+        pipe = self.pipe_stream.nearest()
+        if pipe is None:
+            pipe_dx, gap_y = float('inf'), GAME_HEIGHT / 2
+        else:
+            pipe_dx, gap_y = pipe[0] - BIRD_X, pipe[1]
+        return self.bird_y, self.bird_velocity, pipe_dx, gap_y
+
+    def step(self, flaps=None):
+        """Advance every living bird one fixed timestep; flaps is a bool array"""
+        alive_before = self.alive.copy()
+        alive = self.alive
+
+        if flaps is not None:
+            self.bird_velocity[np.asarray(flaps, dtype=bool) & alive] = JUMP_STRENGTH
+
+        # Update bird position and velocity
+        self.bird_velocity[alive] += GRAVITY
+        self.bird_y[alive] += self.bird_velocity[alive]
+
+        # Keep birds within bounds
+        too_high = alive & (self.bird_y < BIRD_MIN_Y)
+        too_low = alive & (self.bird_y > BIRD_MAX_Y)
+        self.bird_y[too_high] = BIRD_MIN_Y
+        self.bird_y[too_low] = BIRD_MAX_Y
+        alive &= ~(too_high | too_low)
+
+        # Pipes are shared, so they only move once per step
+        self.pipe_stream.update()
+
+        # Only the pipe nearest BIRD_X can touch a bird
+        collided = np.zeros(self.num_birds, dtype=bool)
+        pipe = self.pipe_stream.nearest()
+        if pipe is not None:
+            x, gap_y = pipe
+            if BIRD_RIGHT > x and BIRD_LEFT < x + PIPE_WIDTH:
+                collided = alive_before & (
+                    (self.bird_y - BIRD_SIZE // 2 < gap_y)
+                    | (self.bird_y + BIRD_SIZE // 2 > gap_y + PIPE_GAP)
+                )
+                alive &= ~collided
+
+        # Score a passed pipe for every bird that did not hit a pipe this step
+        if self.pipe_stream.mark_passed():
+            self.score += alive_before & ~collided
+
+        self.frames_alive += alive_before
+        self.frame += 1
+        return int(alive.sum())
+
+    def run(self, controller, max_frames=10000):
+        """Run until every bird is dead or max_frames; controller(*observe()) returns flaps"""
+        while self.frame < max_frames and self.alive.any():
+            self.step(controller(*self.observe()))
+        return self.score
@@ -0,0 +1,56 @@
+"""
+Client module - browser-side rendering and interpolation for the game loop
+
+The smooth loop mode draws the game with a static Streamlit component
+(frontend/index.html, plain JavaScript with no build step). The page is
+mounted once and keeps its canvas and animation alive; render_client()
+only sends it the compact state from FixedTimestepLoop.snapshot(). The
+page runs the same per-tick physics locally, including a queued flap,
+and interpolates within each tick at the display refresh rate (about
+60 fps) until the next state arrives from the server.
+"""
+
+import os
+
+import streamlit.components.v1 as components
+
+from .engine import (
+    BIRD_MAX_Y, BIRD_MIN_Y, BIRD_SIZE, BIRD_X, GAME_HEIGHT, GAME_WIDTH, GRAVITY,
+    GROUND_HEIGHT, JUMP_STRENGTH, PIPE_GAP, PIPE_SPEED, PIPE_WIDTH
+)
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+# Constants shared with the page's physics and drawing code
+CLIENT_CONSTANTS = {
+    'width': GAME_WIDTH,
+    'height': GAME_HEIGHT,
+    'birdX': BIRD_X,
+    'birdSize': BIRD_SIZE,
+    'birdMinY': BIRD_MIN_Y,
+    'birdMaxY': BIRD_MAX_Y,
+    'gravity': GRAVITY,
+    'jumpStrength': JUMP_STRENGTH,
+    'ground': GROUND_HEIGHT,
+    'pipeWidth': PIPE_WIDTH,
+    'pipeGap': PIPE_GAP,
+    'pipeSpeed': PIPE_SPEED
+}
+
+_client = components.declare_component("flappy_client", path=FRONTEND_DIR)
+
+def render_client(state, tick_seconds, sync_seconds, key="flappy_client"):
+    """Send a snapshot from FixedTimestepLoop to the mounted client page
+
+    Keep key stable between reruns so Streamlit updates the existing page
+    instead of mounting a new one.
+    """
+    _client(
+        constants=CLIENT_CONSTANTS,
+        state=state,
+        tick_ms=tick_seconds * 1000,
+        # Allow one extra sync interval of prediction before freezing
+        max_ahead_ticks=2 * sync_seconds / tick_seconds,
+        key=key,
+        default=None
+    )
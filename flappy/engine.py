@@ -0,0 +1,213 @@
+"""
+Engine module - headless Flappy Bird physics
+
+FlappyEngine runs the same physics as the Streamlit app without touching
+st.session_state: one call to step() advances one fixed timestep. Pipes
+come from a seeded PipeStream kept in a fixed-size ring buffer, and
+collisions are only tested against the pipe nearest BIRD_X.
+"""
+
+import random
+
+# Game constants
+BIRD_SIZE = 30
+PIPE_WIDTH = 80
+PIPE_GAP = 150
+PIPE_SPEED = 4
+GRAVITY = 1.2
+JUMP_STRENGTH = -15
+GAME_WIDTH = 800
+GAME_HEIGHT = 600
+BIRD_X = 150
+GROUND_HEIGHT = 50
+PIPE_SPACING = 250  # A new pipe spawns once the last one is this far in
+
+FRAME_SECONDS = 0.05  # Fixed timestep of one step()
+
+BIRD_LEFT = BIRD_X - BIRD_SIZE // 2
+BIRD_RIGHT = BIRD_X + BIRD_SIZE // 2
+BIRD_MIN_Y = BIRD_SIZE
+BIRD_MAX_Y = GAME_HEIGHT - BIRD_SIZE - GROUND_HEIGHT
+
+class PipeRing:
+    """Fixed-capacity ring buffer of pipes, oldest first"""
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.x = [0] * capacity
+        self.gap_y = [0] * capacity
+        self.head = 0   # Absolute index of the oldest pipe
+        self.tail = 0   # Absolute index the next pipe is written to
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def __iter__(self):
+        """Iterate (x, gap_y) of the pipes, oldest first, without copying"""
+        x, gap_y, capacity = self.x, self.gap_y, self.capacity
+        for index in range(self.head, self.tail):
+            slot = index % capacity
+            yield x[slot], gap_y[slot]
+
+    def __getitem__(self, index):
+        """Get (x, gap_y) of the pipe at an absolute index"""
+        slot = index % self.capacity
+        return self.x[slot], self.gap_y[slot]
+
+    def append(self, x, gap_y):
+        if len(self) == self.capacity:
+            raise OverflowError("Pipe ring buffer is full")
+        slot = self.tail % self.capacity
+        self.x[slot] = x
+        self.gap_y[slot] = gap_y
+        self.tail += 1
+
+    def popleft(self):
+        self.head += 1
+
+    def clear(self):
+        self.head = self.tail = 0
+
+class PipeStream:
+    """Seeded stream of pipes scrolling towards the bird"""
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.ring = PipeRing()
+        self.next_unpassed = 0  # Absolute index of the first pipe not yet scored
+
+    def create_pipe(self, x_position):
+        """Create a new pipe with random gap position"""
+        gap_y = self.rng.randint(150, GAME_HEIGHT - PIPE_GAP - 150)
+        self.ring.append(x_position, gap_y)
+
+    def update(self):
+        """Update pipe positions and create new ones"""
+        ring = self.ring
+        x = ring.x
+
+        # Move existing pipes
+        for index in range(ring.head, ring.tail):
+            x[index % ring.capacity] -= PIPE_SPEED
+
+        # Remove pipes that are off screen
+        while len(ring) and x[ring.head % ring.capacity] <= -PIPE_WIDTH:
+            ring.popleft()
+        self.next_unpassed = max(self.next_unpassed, ring.head)
+
+        # Add new pipes
+        if not len(ring) or x[(ring.tail - 1) % ring.capacity] < GAME_WIDTH - PIPE_SPACING:
+            self.create_pipe(GAME_WIDTH)
+
+    def nearest(self):
+        """Get (x, gap_y) of the first pipe not yet fully behind the bird, or None"""
+        for x, gap_y in self.ring:
+            if x + PIPE_WIDTH > BIRD_LEFT:
+                return x, gap_y
+        return None
+
+    def mark_passed(self):
+        """Mark the next pipe as passed once it is behind BIRD_X; True if it was"""
+        if self.next_unpassed < self.ring.tail:
+            x, _ = self.ring[self.next_unpassed]
+            if x + PIPE_WIDTH < BIRD_X:
+                self.next_unpassed += 1
+                return True
+        return False
+
+def collides(bird_y, pipe):
+    """Check whether a bird at bird_y hits the given (x, gap_y) pipe"""
+    if pipe is None:
+        return False
+    x, gap_y = pipe
+
+    # Check if bird is horizontally aligned with pipe
+    if BIRD_RIGHT > x and BIRD_LEFT < x + PIPE_WIDTH:
+        # Check collision with top and bottom pipe
+        return bird_y - BIRD_SIZE // 2 < gap_y or bird_y + BIRD_SIZE // 2 > gap_y + PIPE_GAP
+    return False
+
+class FlappyEngine:
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.timer = None  # Optional FrameTimer for per-stage timings
+        self.reset()
+
+    def reset(self):
+        """Reset game to initial state"""
+        self.bird_y = GAME_HEIGHT // 2
+        self.bird_velocity = 0
+        self.pipe_stream = PipeStream(self.seed)
+        self.score = 0
+        self.frame = 0
+        self.game_over = False
+        self.flap_frames = []  # Frames where FLAP was pressed, for replay
+
+    def flap(self):
+        """Make the bird jump"""
+        self.bird_velocity = JUMP_STRENGTH
+        if not self.flap_frames or self.flap_frames[-1] != self.frame:
+            self.flap_frames.append(self.frame)
+
+    def update_bird(self):
+        """Update bird position and velocity"""
+        self.bird_velocity += GRAVITY
+        self.bird_y += self.bird_velocity
+
+        # Keep bird within bounds (accounting for ground)
+        if self.bird_y < BIRD_MIN_Y:
+            self.bird_y = BIRD_MIN_Y
+            self.game_over = True
+        elif self.bird_y > BIRD_MAX_Y:
+            self.bird_y = BIRD_MAX_Y
+            self.game_over = True
+
+    def update_pipes(self):
+        """Update pipe positions and create new ones"""
+        self.pipe_stream.update()
+
+    def check_collisions(self):
+        """Check for collisions with the nearest pipe and score passed pipes"""
+        if collides(self.bird_y, self.pipe_stream.nearest()):
+            self.game_over = True
+            return
+
+        if self.pipe_stream.mark_passed():
+            self.score += 1
+
+    def step(self, flap=False):
+        """Advance one fixed timestep; returns False once the game is over"""
+        if self.timer is not None:
+            return self._timed_step(flap)
+
+        if flap:
+            self.flap()
+        self.update_bird()
+        self.update_pipes()
+        self.check_collisions()
+        self.frame += 1
+        return not self.game_over
+
+    def _timed_step(self, flap):
+        """step() with each physics stage timed by self.timer"""
+        stage = self.timer.stage
+        if flap:
+            self.flap()
+        with stage('update_bird'):
+            self.update_bird()
+        with stage('update_pipes'):
+            self.update_pipes()
+        with stage('check_collisions'):
+            self.check_collisions()
+        self.frame += 1
+        return not self.game_over
+
+    def recording(self):
+        """Get the run as a seed plus flap frames, enough to replay it exactly"""
+        return {
+            'seed': self.seed,
+            'flaps': list(self.flap_frames),
+            'frames': self.frame,
+            'score': self.score
+        }
@@ -0,0 +1,134 @@
+"""
+Leaderboard module - SQLite leaderboard of verified scores
+
+Scores are only accepted after the recorded run has been re-simulated.
+Accepted scores are buffered and written in batches, once the batch is
+full or, from a background timer, once its oldest score has waited
+flush_seconds, so a lone score is not held until the next submit or a
+clean exit. Anything still queued is written on interpreter exit. Reads never force a write: top() merges buffered scores into the
+indexed top-N query in memory. Connections come from a small pool so
+concurrent sessions do not reopen the database.
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+from .replay import verify_run
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    flaps BLOB NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_rank ON scores (score DESC, created ASC);
+"""
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared across threads"""
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.connections = queue.Queue(maxsize=size)
+        for _ in range(size):
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.connections.put(connection)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, committing on success"""
+        connection = self.connections.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self.connections.put(connection)
+
+    def close(self):
+        while not self.connections.empty():
+            self.connections.get_nowait().close()
+
+class Leaderboard:
+    def __init__(self, path="leaderboard.db", pool_size=4, batch_size=32, flush_seconds=5.0):
+        self.pool = ConnectionPool(path, pool_size)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.pending = []
+        self.flush_timer = None  # Writes the batch flush_seconds after its first score
+        self.lock = threading.Lock()
+
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+        # Queued scores would otherwise be lost when the process exits
+        atexit.register(self.close)
+
+    def submit(self, player, seed, flap_frames, claimed_score):
+        """Verify a run and queue its score; returns whether it was accepted"""
+        if not verify_run(seed, flap_frames, claimed_score):
+            return False
+
+        row = (player, claimed_score, seed, array('I', flap_frames).tobytes(), time.time())
+        with self.lock:
+            if not self.pending:
+                self.flush_timer = threading.Timer(self.flush_seconds, self.flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+            self.pending.append(row)
+            if len(self.pending) < self.batch_size:
+                return True
+
+        self.flush()
+        return True
+
+    def flush(self):
+        """Write any queued scores"""
+        with self.lock:
+            batch, self.pending = self.pending, []
+            timer, self.flush_timer = self.flush_timer, None
+
+        # Stop the age timer, or let it finish a write it already started
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+            timer.join()
+        if batch:
+            self._write(batch)
+
+    def top(self, n=10):
+        """Get the best n scores as (player, score, created) rows, including queued ones"""
+        with self.lock:
+            queued = [(player, score, created) for player, score, _, _, created in self.pending]
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT player, score, created FROM scores "
+                "ORDER BY score DESC, created ASC LIMIT ?",
+                (n,)
+            ).fetchall()
+
+        if not queued:
+            return rows
+        rows.extend(queued)
+        rows.sort(key=lambda row: (-row[1], row[2]))
+        return rows[:n]
+
+    def close(self):
+        atexit.unregister(self.close)
+        self.flush()
+        self.pool.close()
+
+    def _write(self, batch):
+        with self.pool.connection() as connection:
+            connection.executemany(
+                "INSERT INTO scores (player, score, seed, flaps, created) VALUES (?, ?, ?, ?, ?)",
+                batch
+            )
@@ -0,0 +1,63 @@
+"""
+Loop module - fixed-timestep game loop decoupled from rendering
+
+FixedTimestepLoop advances a FlappyEngine by however many fixed ticks of
+wall-clock time have passed since the last call, so physics runs at the
+same rate no matter how often the page is re-rendered. Flaps are queued
+as input deltas and applied on the next tick.
+"""
+
+import time
+
+from .engine import FRAME_SECONDS
+
+class FixedTimestepLoop:
+    def __init__(self, engine, tick_seconds=FRAME_SECONDS, max_catch_up_ticks=200,
+                 clock=time.monotonic):
+        self.engine = engine
+        self.tick_seconds = tick_seconds
+        self.max_catch_up_ticks = max_catch_up_ticks  # Limit after long pauses
+        self.clock = clock
+        self.last_time = clock()
+        self.accumulator = 0.0
+        self.pending_flap = False
+
+    def advance(self):
+        """Step the engine for the time elapsed since the last call; returns ticks run"""
+        now = self.clock()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks = int(self.accumulator // self.tick_seconds)
+        self.accumulator -= ticks * self.tick_seconds
+        if ticks > self.max_catch_up_ticks:
+            ticks = self.max_catch_up_ticks
+            self.accumulator = 0.0
+
+        for _ in range(ticks):
+            if self.engine.game_over:
+                break
+            self.engine.step(self.pending_flap)
+            self.pending_flap = False
+        return ticks
+
+    def queue_flap(self):
+        """Catch up to now, then flap on the next tick"""
+        self.advance()
+        self.pending_flap = True
+
+    def snapshot(self):
+        """Get the compact state sent to the client"""
+        engine = self.engine
+        return {
+            'f': engine.frame,
+            'y': round(engine.bird_y, 2),
+            'v': round(engine.bird_velocity, 2),
+            'p': [[x, gap_y] for x, gap_y in engine.pipe_stream.ring],
+            's': engine.score,
+            'o': engine.game_over,
+            # A flap queued since the last tick, so the client predicts it too
+            'q': self.pending_flap,
+            # Fraction of a tick already elapsed, so the client starts in phase
+            'a': round(self.accumulator / self.tick_seconds, 3)
+        }
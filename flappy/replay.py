@@ -0,0 +1,44 @@
+"""
+Replay module - deterministic re-simulation of recorded runs
+
+A run is recorded as the engine seed plus the frames where FLAP was
+pressed. Re-simulating it headlessly reproduces the score exactly, so a
+claimed score can be verified on the server instead of being trusted.
+"""
+
+from .engine import FlappyEngine
+
+MAX_REPLAY_FRAMES = 20 * 60 * 60  # One hour of play at 20 frames per second
+
+def resimulate(seed, flap_frames, max_frames=MAX_REPLAY_FRAMES):
+    """Replay a run until the bird crashes; returns the finished engine
+
+    Returns None if the recording is malformed: flap frames out of order,
+    after the crash, or a run longer than max_frames.
+    """
+    engine = FlappyEngine(seed)
+    step = engine.step
+    previous = -1
+
+    for flap_frame in flap_frames:
+        if flap_frame <= previous or flap_frame >= max_frames:
+            return None
+        previous = flap_frame
+
+        # Fall freely until the flap frame, then flap on that frame
+        while engine.frame < flap_frame and step():
+            pass
+        if engine.game_over:
+            return None  # Flaps recorded after the crash
+        step(True)
+
+    while not engine.game_over:
+        if engine.frame >= max_frames:
+            return None
+        step()
+    return engine
+
+def verify_run(seed, flap_frames, claimed_score, max_frames=MAX_REPLAY_FRAMES):
+    """Check a claimed score by re-simulating the recorded run"""
+    engine = resimulate(seed, flap_frames, max_frames)
+    return engine is not None and engine.score == claimed_score
@@ -0,0 +1,103 @@
+"""
+Timing module - per-frame stage timers with rolling percentiles
+
+FrameTimer keeps the most recent samples of each stage in fixed-size ring
+buffers and reports p50/p95/p99 over them. When disabled, stage() returns
+a shared no-op context manager and nothing is recorded.
+"""
+
+import contextlib
+import csv
+import io
+import math
+import time
+from array import array
+
+STAGES = (
+    'update_bird',
+    'update_pipes',
+    'check_collisions',
+    'create_game_visual',
+    'plotly_chart',
+    'frame_interval'
+)
+PERCENTILES = (50, 95, 99)
+
+_NO_TIMING = contextlib.nullcontext()
+
+class FrameTimer:
+    def __init__(self, capacity=600, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.samples = {name: array('d', [math.nan] * capacity) for name in STAGES}
+        self.counts = dict.fromkeys(STAGES, 0)  # Samples recorded per stage, ever
+        self.last_frame = None
+
+    def stage(self, name):
+        """Time a block as the given stage"""
+        if not self.enabled:
+            return _NO_TIMING
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Store one sample (in seconds) for a stage"""
+        count = self.counts[name]
+        self.samples[name][count % self.capacity] = seconds
+        self.counts[name] = count + 1
+
+    def mark_frame(self):
+        """Record the interval since the previous frame started"""
+        if not self.enabled:
+            self.last_frame = None
+            return
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.record('frame_interval', now - self.last_frame)
+        self.last_frame = now
+
+    def history(self, name):
+        """Get a stage's buffered samples in milliseconds, oldest first"""
+        count = self.counts[name]
+        buffer = self.samples[name]
+        if count <= self.capacity:
+            ordered = buffer[:count]
+        else:
+            start = count % self.capacity
+            ordered = buffer[start:] + buffer[:start]
+        return [seconds * 1000 for seconds in ordered]
+
+    def percentiles(self):
+        """Get {stage: {'samples': n, 'p50': ms, 'p95': ms, 'p99': ms}}"""
+        summary = {}
+        for name in STAGES:
+            values = sorted(self.history(name))
+            row = {'samples': len(values)}
+            for p in PERCENTILES:
+                # Nearest-rank percentile
+                row[f'p{p}'] = values[max(0, math.ceil(p / 100 * len(values)) - 1)] if values else None
+            summary[name] = row
+        return summary
+
+    def to_csv(self):
+        """Export the buffered samples (ms) as CSV, one column per stage"""
+        histories = [self.history(name) for name in STAGES]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(('sample',) + STAGES)
+        for i in range(max(map(len, histories))):
+            writer.writerow([i] + [f"{h[i]:.4f}" if i < len(h) else '' for h in histories])
+        return output.getvalue()
+
+    def reset(self):
+        for name in STAGES:
+            self.samples[name] = array('d', [math.nan] * self.capacity)
+            self.counts[name] = 0
+        self.last_frame = None
@@ -1,22 +0,0 @@
-"""
-Ludo Game Package
-
-A complete implementation of the classic Ludo board game.
-"""
-
-from .board import Board
-from .game import Game
-from .player import Player
-from .utils import roll_dice, get_safe_positions, calculate_position
-
-__version__ = "1.0.0"
-__author__ = "Ludo Game Developer"
-
-__all__ = [
-    "Board",
-    "Game", 
-    "Player",
-    "roll_dice",
-    "get_safe_positions",
-    "calculate_position"
-]
@@ -0,0 +1,47 @@
+"""
+Ludo Game Package
+
+A complete implementation of the classic Ludo board game.
+
+The core engine (Board, Game, Player and the utils helpers) is imported
+eagerly. Optional submodules listed in _LAZY_SUBMODULES are only imported
+the first time they are accessed as attributes, e.g. ``ludo.<name>``, so
+``import ludo`` stays cheap for the CLI and for short-lived pool workers.
+"""
+
+import importlib
+
+from . import utils
+from .board import Board
+from .game import Game
+from .player import Player
+from .rules import Rules
+from .utils import roll_dice, get_safe_positions, calculate_position
+
+__version__ = "1.0.0"
+__author__ = "Ludo Game Developer"
+
+# Optional submodules loaded on first attribute access
+_LAZY_SUBMODULES = ("fuzz", "sweep", "sync")
+
+__all__ = [
+    "Board",
+    "Game",
+    "Player",
+    "Rules",
+    "utils",
+    "roll_dice",
+    "get_safe_positions",
+    "calculate_position"
+]
+
+def __getattr__(name):
+    """Import optional submodules lazily on first access"""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module  # Cache so __getattr__ is not hit again
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -0,0 +1,319 @@
+"""
+Fuzz module - differential fuzzing between the reference Game and a candidate engine
+
+A candidate engine is any factory called as ``factory(num_players, rules)``
+that returns an object with three methods:
+
+    movable_tokens(dice_value) -> token indices the current player can move
+    play_turn(token_index, dice_value) -> play one turn (None passes)
+    state() -> (current_player_index, game_over, token positions per player)
+
+Both engines are driven with identical dice and token choices. The first
+divergence is shrunk to a minimal reproducing move sequence. Usage:
+
+    python -m ludo.fuzz package.module:Factory --games 10000 --processes 8
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import random
+import time
+
+from .game import Game
+from .rules import MAX_DICE_VALUE, Rules
+
+class ReferenceEngine:
+    """Adapter exposing the reference Game through the engine interface"""
+
+    def __init__(self, num_players=4, rules=None):
+        self.game = Game(num_players, rules)
+
+    def movable_tokens(self, dice_value):
+        return self.game.get_movable_tokens(self.game.current_player(), dice_value)
+
+    def play_turn(self, token_index, dice_value):
+        self.game.play_turn(token_index, dice_value)
+
+    def state(self):
+        return (
+            self.game.current_player_index,
+            self.game.game_over,
+            tuple(tuple(p.get_token_positions()) for p in self.game.players)
+        )
+
+class Divergence(Exception):
+    """Raised when a candidate engine disagrees with the reference"""
+
+    def __init__(self, step, reason, expected, actual):
+        super().__init__(f"Step {step}: {reason} differ (expected {expected!r}, got {actual!r})")
+        self.step = step
+        self.reason = reason
+        self.expected = expected
+        self.actual = actual
+
+def _compare(step, reason, expected, actual):
+    if expected != actual:
+        raise Divergence(step, reason, expected, actual)
+
+def _check_step(step, reference, candidate, dice_value, token_index):
+    """Play one step on both engines and compare them"""
+    expected = sorted(reference.movable_tokens(dice_value))
+    try:
+        actual = sorted(candidate.movable_tokens(dice_value))
+    except Exception as exc:
+        raise Divergence(step, 'movable tokens', expected, exc)
+    _compare(step, 'movable tokens', expected, actual)
+
+    reference.play_turn(token_index, dice_value)
+    try:
+        candidate.play_turn(token_index, dice_value)
+        actual = candidate.state()
+    except Exception as exc:
+        raise Divergence(step, 'state', reference.state(), exc)
+    _compare(step, 'state', reference.state(), actual)
+
+def run_random_game(factory, seed, num_players=4, rules=None, max_turns=2000):
+    """Play one seeded random game on both engines; returns (steps, divergence)"""
+    rng = random.Random(seed)
+    reference = ReferenceEngine(num_players, rules)
+    candidate = factory(num_players, rules)
+    steps = []
+
+    while not reference.game.game_over and len(steps) < max_turns:
+        dice_value = rng.randint(1, MAX_DICE_VALUE)
+        movable = reference.movable_tokens(dice_value)
+        token_index = rng.choice(movable) if movable else None
+        steps.append((dice_value, token_index))
+        try:
+            _check_step(len(steps) - 1, reference, candidate, dice_value, token_index)
+        except Divergence as divergence:
+            return steps, divergence
+
+    return steps, None
+
+def replay(factory, steps, num_players=4, rules=None):
+    """Replay (dice, token) steps on both engines
+
+    Returns the Divergence found, or None if the engines agree. Returns
+    False if the sequence is not legal for the reference engine.
+    """
+    reference = ReferenceEngine(num_players, rules)
+    candidate = factory(num_players, rules)
+
+    for step, (dice_value, token_index) in enumerate(steps):
+        if reference.game.game_over:
+            return False
+        if token_index is not None and token_index not in reference.movable_tokens(dice_value):
+            return False
+        try:
+            _check_step(step, reference, candidate, dice_value, token_index)
+        except Divergence as divergence:
+            return divergence
+    return None
+
+PASS_STEP = (1, None)  # Filler turn for a seat with no moves left in a shrink trial
+
+def _seat_moves(steps, num_players=4, rules=None):
+    """Split a legal step sequence into per-seat lists, following the turn order"""
+    reference = ReferenceEngine(num_players, rules)
+    seats = [[] for _ in range(num_players)]
+    for dice_value, token_index in steps:
+        seats[reference.game.current_player_index].append((dice_value, token_index))
+        reference.play_turn(token_index, dice_value)
+    return seats
+
+def _interleave(seats, num_players=4, rules=None):
+    """Rebuild a step sequence from per-seat lists; None if it is not legal
+
+    Seats that have run out of moves pass, so removing a turn from one seat
+    never shifts the moves of the others onto the wrong player.
+    """
+    reference = ReferenceEngine(num_players, rules)
+    next_move = [0] * num_players
+    remaining = sum(len(moves) for moves in seats)
+    steps = []
+
+    while remaining and not reference.game.game_over:
+        seat = reference.game.current_player_index
+        if next_move[seat] < len(seats[seat]):
+            dice_value, token_index = seats[seat][next_move[seat]]
+            next_move[seat] += 1
+            remaining -= 1
+        else:
+            dice_value, token_index = PASS_STEP
+
+        if token_index is not None and token_index not in reference.movable_tokens(dice_value):
+            return None
+        reference.play_turn(token_index, dice_value)
+        steps.append((dice_value, token_index))
+    return steps
+
+def _size(steps):
+    """Ordering for shrink progress: fewer steps, then fewer real moves"""
+    return len(steps), sum(token_index is not None for _, token_index in steps)
+
+def shrink(factory, steps, num_players=4, rules=None):
+    """Reduce a diverging step sequence to a minimal one that still diverges"""
+    def diverging_prefix(candidate_steps):
+        # The shortest prefix of candidate_steps that diverges, or None
+        if not candidate_steps:
+            return None
+        divergence = replay(factory, candidate_steps, num_players, rules)
+        if not divergence:
+            return None
+        return candidate_steps[:divergence.step + 1]
+
+    steps = diverging_prefix(list(steps))
+    changed = True
+    while changed:
+        changed = False
+
+        # Remove chunks, halving the chunk size until single steps are tried.
+        # Whole rounds (num_players steps) keep the turn order intact.
+        chunk_sizes = []
+        chunk = max(1, len(steps) // 2)
+        while chunk >= 1:
+            chunk_sizes.append(chunk)
+            chunk //= 2
+        chunk_sizes.append(num_players)
+
+        for chunk in chunk_sizes:
+            start = 0
+            while start < len(steps):
+                trial = diverging_prefix(steps[:start] + steps[start + chunk:])
+                if trial is not None:
+                    steps = trial
+                    changed = True
+                else:
+                    start += 1 if chunk == num_players else chunk
+
+        # Work per seat and re-interleave, so passes that only kept other
+        # seats aligned disappear too: first drop every move of one token,
+        # then single turns
+        seats = _seat_moves(steps, num_players, rules)
+        for seat in range(num_players):
+            tokens = {token_index for _, token_index in seats[seat]}
+            for token in sorted(tokens - {None}):
+                trial_seats = [list(moves) for moves in seats]
+                trial_seats[seat] = [move for move in seats[seat] if move[1] != token]
+                trial = _interleave(trial_seats, num_players, rules)
+                trial = diverging_prefix(trial) if trial is not None else None
+                if trial is not None and _size(trial) < _size(steps):
+                    steps = trial
+                    seats = _seat_moves(steps, num_players, rules)
+                    changed = True
+
+            i = 0
+            while i < len(seats[seat]):
+                trial_seats = [list(moves) for moves in seats]
+                del trial_seats[seat][i]
+                trial = _interleave(trial_seats, num_players, rules)
+                trial = diverging_prefix(trial) if trial is not None else None
+                if trial is not None and _size(trial) < _size(steps):
+                    steps = trial
+                    seats = _seat_moves(steps, num_players, rules)
+                    changed = True
+                else:
+                    i += 1
+
+        # Prefer passing over moving, and smaller dice, where it still diverges
+        i = 0
+        while i < len(steps):
+            dice_value, token_index = steps[i]
+            simpler_steps = [(dice_value, None)] if token_index is not None else []
+            simpler_steps += [(d, token_index) for d in range(1, dice_value)]
+            for simpler in simpler_steps:
+                trial = diverging_prefix(steps[:i] + [simpler] + steps[i + 1:])
+                if trial is not None and len(trial) > i:
+                    steps = trial
+                    changed = True
+                    break
+            i += 1
+
+    return steps, replay(factory, steps, num_players, rules)
+
+def load_factory(path):
+    """Load an engine factory from a 'module:attribute' path"""
+    module_name, _, attribute = path.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+def _fuzz_seeds(task):
+    """Worker: play a range of seeds, stopping at the first divergence"""
+    factory_path, seeds, num_players, rules, max_turns = task
+    factory = load_factory(factory_path)
+    turns = 0
+
+    for seed in seeds:
+        steps, divergence = run_random_game(factory, seed, num_players, rules, max_turns)
+        turns += len(steps)
+        if divergence is not None:
+            return turns, seed, steps
+    return turns, None, None
+
+def fuzz(factory_path, games=1000, first_seed=0, num_players=4, rules=None,
+         processes=None, chunk_size=50, max_turns=2000):
+    """Fuzz a candidate engine against the reference across a process pool"""
+    seeds = range(first_seed, first_seed + games)
+    tasks = [
+        (factory_path, seeds[i:i + chunk_size], num_players, rules, max_turns)
+        for i in range(0, len(seeds), chunk_size)
+    ]
+
+    start = time.perf_counter()
+    turns = 0
+    failures = []
+
+    with multiprocessing.Pool(processes) as pool:
+        for task_turns, seed, steps in pool.imap_unordered(_fuzz_seeds, tasks):
+            turns += task_turns
+            if seed is not None:
+                failures.append((seed, steps))
+                pool.terminate()
+                break
+
+    seconds = time.perf_counter() - start
+    report = {
+        'games': games,
+        'turns': turns,
+        'seconds': seconds,
+        'turns_per_second': turns / seconds if seconds else 0.0,
+        'seed': None,
+        'steps': None,
+        'divergence': None
+    }
+
+    if failures:
+        seed, steps = min(failures)
+        steps, divergence = shrink(load_factory(factory_path), steps, num_players, rules)
+        report.update(seed=seed, steps=steps, divergence=divergence)
+
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential fuzzing against the reference Ludo engine")
+    parser.add_argument('factory', help="candidate engine factory as module:attribute")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--variant', default='classic')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--max-turns', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    report = fuzz(args.factory, args.games, args.seed, args.players,
+                  Rules.variant(args.variant), args.processes, max_turns=args.max_turns)
+
+    print(f"{report['turns']} turns in {report['seconds']:.2f}s "
+          f"({report['turns_per_second']:.0f} turns/s)")
+    if report['divergence'] is None:
+        print(f"No divergence in {report['games']} games")
+        return 0
+
+    print(f"Divergence from seed {report['seed']}: {report['divergence']}")
+    print(f"Minimal sequence ({len(report['steps'])} steps of (dice, token)):")
+    print(report['steps'])
+    return 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -2,30 +2,55 @@
 Game module - main game logic and state management
 """
 
+import random
+
 from .board import Board
 from .player import Player
+from .rules import Rules, HOME_BASE, HOME_STRETCH_START
 from .utils import roll_dice
 
 class Game:
-    def __init__(self, num_players=4):
-        self.board = Board()
+    def __init__(self, num_players=4, rules=None, seed=None):
+        # Compile the rule variant once; everything below reads the tables
+        if rules is None:
+            rules = Rules()
+        self.rules = rules.compile(num_players)
+        
+        self.board = Board(self.rules)
         self.num_players = num_players
         self.current_player_index = 0
         self.game_over = False
         self.winner = None
+        self.bonus_roll = False  # Set when the last move earned an extra roll
+        
+        # Dice come from a per-game generator so a seed replays the game exactly
+        self.seed = seed
+        self.rng = random.Random(seed)
+        
+        # Bind variant-specific checks here instead of branching per move
+        if self.rules.blockades:
+            self._get_blocking_squares = self._get_blockades
+            self._is_move_blocked = self._is_blocked_by_blockade
+        else:
+            self._get_blocking_squares = self._get_own_squares
+            self._is_move_blocked = self._is_blocked_by_own_token_move
+        self._capture_grants_bonus = self.rules.capture_bonus_roll
         
         # Initialize players
-        colors = ['red', 'blue', 'yellow', 'green'][:num_players]
         self.players = []
         
-        for i, color in enumerate(colors):
+        for i, color in enumerate(self.rules.colors):
             player_name = f"Player {i+1}"
-            self.players.append(Player(player_name, color))
+            self.players.append(Player(player_name, color, self.rules))
     
     def current_player(self):
         """Get the current player"""
         return self.players[self.current_player_index]
     
+    def roll_dice(self):
+        """Roll the dice using this game's random generator"""
+        return roll_dice(self.rng)
+    
     def next_turn(self):
         """Move to the next player's turn"""
         if not self.game_over:
@@ -34,21 +59,24 @@ class Game:
     def get_movable_tokens(self, player, dice_value):
         """Get list of tokens that can be moved with the given dice value"""
         movable_tokens = []
+        blocking = None  # Blocking squares, found once for all tokens if needed
         
         for i, token in enumerate(player.tokens):
             new_position = self.board.get_next_position(token.position, dice_value, player.color)
             
             # Check if move is valid
             if new_position != token.position:  # Position would change
-                # Check for blocking by own tokens
-                if not self._is_blocked_by_own_token(player, new_position):
+                # Check for blocking (own tokens, or blockades in that variant)
+                if blocking is None:
+                    blocking = self._get_blocking_squares(player)
+                if not self._is_move_blocked(player, token.position, dice_value, new_position, blocking):
                     movable_tokens.append(i)
         
         return movable_tokens
     
     def _is_blocked_by_own_token(self, player, position):
         """Check if position is blocked by player's own token"""
-        if position >= 100:  # Home stretch - no blocking
+        if position >= HOME_STRETCH_START:  # Home stretch - no blocking
             return False
         
         for token in player.tokens:
@@ -56,6 +84,41 @@ class Game:
                 return True
         return False
     
+    def _get_own_squares(self, player):
+        """Get squares holding the player's own tokens"""
+        return {token.position for token in player.tokens}
+    
+    def _is_blocked_by_own_token_move(self, player, old_position, dice_value, new_position, own_squares):
+        """Classic rules: a token may not land on its own color"""
+        return new_position < HOME_STRETCH_START and new_position in own_squares
+    
+    def _is_blocked_by_blockade(self, player, old_position, dice_value, new_position, blockades):
+        """Blockade rules: no landing on or passing two opposing tokens on one square"""
+        if not blockades:
+            return False
+        
+        path = self.board.move_table[player.color][old_position]
+        for steps in range(1, dice_value + 1):
+            if path[steps] in blockades:
+                return True
+        return False
+    
+    def _get_blockades(self, player):
+        """Get main track squares holding two or more tokens of another player"""
+        blockades = set()
+        for other_player in self.players:
+            if other_player == player:
+                continue
+            
+            seen = set()
+            for token in other_player.tokens:
+                position = token.position
+                if 1 <= position <= self.rules.board_size:
+                    if position in seen:
+                        blockades.add(position)
+                    seen.add(position)
+        return blockades
+    
     def move_token(self, player, token_index, dice_value):
         """Move a specific token and handle captures"""
         if token_index >= len(player.tokens):
@@ -69,6 +132,7 @@ class Game:
         
         # Check for captures
         captured = self._check_captures(player, new_position)
+        self.bonus_roll = self._capture_grants_bonus and bool(captured)
         
         # Update token position
         old_position = token.position
@@ -79,6 +143,22 @@ class Game:
         
         return True
     
+    def play_turn(self, token_index, dice_value):
+        """Play one turn for the current player (token_index None passes)"""
+        player = self.current_player()
+        self.bonus_roll = False
+        moved = False
+        
+        if token_index is not None:
+            moved = self.move_token(player, token_index, dice_value)
+            if moved:
+                self.check_win(player)
+        
+        # A bonus roll keeps the turn with the same player
+        if not self.bonus_roll:
+            self.next_turn()
+        return moved
+    
     def _check_captures(self, attacking_player, position):
         """Check and handle token captures at the given position"""
         captured_tokens = []
@@ -91,9 +171,9 @@ class Game:
                 if token.position == position:
                     if self.board.can_capture(position, attacking_player.color, other_player.color):
                         # Send token back to home
-                        token.position = -1
+                        token.position = HOME_BASE
                         captured_tokens.append(token)
-                        self._update_player_stats(other_player, position, -1)
+                        self._update_player_stats(other_player, position, HOME_BASE)
         
         return captured_tokens
     
@@ -106,16 +186,16 @@ class Game:
         
         # Count tokens in each state
         for token in player.tokens:
-            if token.position == -1:
+            if token.position == HOME_BASE:
                 player.tokens_in_home += 1
-            elif token.position == 105:  # Finished position
+            elif token.position == self.rules.finish_position:
                 player.tokens_finished += 1
             else:
                 player.tokens_in_play += 1
     
     def check_win(self, player):
         """Check if player has won the game"""
-        if player.tokens_finished == 4:
+        if player.tokens_finished == self.rules.tokens_per_player:
             self.game_over = True
             self.winner = player
             return True
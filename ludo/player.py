@@ -2,34 +2,38 @@
 Player module - handles individual player data and tokens
 """
 
+from .rules import CLASSIC_RULES, HOME_BASE, HOME_STRETCH_START, MAX_DICE_VALUE
+
 class Token:
-    def __init__(self):
-        self.position = -1  # -1 means in home base
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else CLASSIC_RULES
+        self.position = HOME_BASE  # -1 means in home base
     
     def is_in_home(self):
         """Check if token is in home base"""
-        return self.position == -1
+        return self.position == HOME_BASE
     
     def is_in_play(self):
         """Check if token is on the main board"""
-        return 1 <= self.position <= 52
+        return 1 <= self.position <= self.rules.board_size
     
     def is_in_home_stretch(self):
         """Check if token is in home stretch"""
-        return 100 <= self.position <= 105
+        return HOME_STRETCH_START <= self.position <= self.rules.finish_position
     
     def is_finished(self):
         """Check if token has reached the finish"""
-        return self.position == 105
+        return self.position == self.rules.finish_position
 
 class Player:
-    def __init__(self, name, color):
+    def __init__(self, name, color, rules=None):
         self.name = name
         self.color = color
-        self.tokens = [Token() for _ in range(4)]  # Each player has 4 tokens
+        self.rules = rules if rules is not None else CLASSIC_RULES
+        self.tokens = [Token(self.rules) for _ in range(self.rules.tokens_per_player)]
         
         # Statistics
-        self.tokens_in_home = 4
+        self.tokens_in_home = len(self.tokens)
         self.tokens_in_play = 0
         self.tokens_finished = 0
     
@@ -66,12 +70,12 @@ class Player:
         
         # Token in home needs a 6 to come out
         if token.is_in_home():
-            return dice_value == 6
+            return dice_value == MAX_DICE_VALUE
         
         # Token in home stretch
         if token.is_in_home_stretch():
-            home_pos = token.position - 100
-            return home_pos + dice_value <= 5
+            home_pos = token.position - HOME_STRETCH_START
+            return home_pos + dice_value <= self.rules.max_home_offset
         
         # Token on main board
         return True
@@ -0,0 +1,182 @@
+"""
+Rules module - data-driven rule variants for the Ludo game
+
+A Rules object is a frozen, hashable description of a variant (board
+size, colors, tokens per player, safe squares and house-rule flags). Game
+compiles it at construction into a CompiledRules object holding
+precomputed lookup tables, so every variant runs on the same engine
+without extra per-move checks. Compiled rules are cached per
+(rules, num_players), so building many games does not rebuild tables.
+"""
+
+HOME_BASE = -1          # Position of a token that has not entered the board
+HOME_STRETCH_START = 100  # First home stretch position
+
+DEFAULT_COLORS = ('red', 'blue', 'yellow', 'green')
+STAR_OFFSET = 8  # Besides start squares, the square this far past each start is safe
+MAX_DICE_VALUE = 6
+
+# Named house-rule presets, applied as keyword overrides to Rules
+VARIANTS = {
+    'classic': {},
+    'quick': {'tokens_per_player': 2},
+    'blockade': {'blockades': True},
+    'capture_bonus': {'capture_bonus_roll': True},
+}
+
+class Rules:
+    def __init__(self, board_size=52, home_size=6, colors=DEFAULT_COLORS,
+                 tokens_per_player=4, start_positions=None,
+                 safe_positions=None, extra_safe_positions=(),
+                 blockades=False, capture_bonus_roll=False):
+        self.board_size = board_size
+        self.home_size = home_size
+        self.colors = tuple(colors)
+        self.tokens_per_player = tokens_per_player
+
+        # Spread start squares evenly around the track unless given
+        if start_positions is None:
+            spacing = board_size // len(self.colors)
+            start_positions = {
+                color: i * spacing + 1 for i, color in enumerate(self.colors)
+            }
+        self.start_positions = tuple((color, start_positions[color]) for color in self.colors)
+
+        # Start squares and the star square past each are safe unless given
+        if safe_positions is None:
+            starts = [start for _, start in self.start_positions]
+            safe_positions = sorted(set(starts) | {
+                (start + STAR_OFFSET - 1) % board_size + 1 for start in starts
+            })
+        self.safe_positions = tuple(safe_positions)
+        self.extra_safe_positions = tuple(extra_safe_positions)
+
+        for name, squares in (('start', [start for _, start in self.start_positions]),
+                              ('safe', self.safe_positions + self.extra_safe_positions)):
+            for square in squares:
+                if not 1 <= square <= board_size:
+                    raise ValueError(f"{name.capitalize()} square {square} is outside 1..{board_size}")
+
+        # House-rule flags
+        self.blockades = blockades
+        self.capture_bonus_roll = capture_bonus_roll
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError("Rules are frozen; build a new Rules instead")
+        super().__setattr__(name, value)
+
+    def _key(self):
+        return (
+            self.board_size, self.home_size, self.colors, self.tokens_per_player,
+            self.safe_positions, self.extra_safe_positions, self.start_positions,
+            self.blockades, self.capture_bonus_roll
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Rules):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    @classmethod
+    def variant(cls, name, **overrides):
+        """Build rules for a named preset from VARIANTS"""
+        if name not in VARIANTS:
+            raise ValueError(f"Unknown rule variant: {name}")
+        options = dict(VARIANTS[name])
+        options.update(overrides)
+        return cls(**options)
+
+    def compile(self, num_players=None):
+        """Compile these rules into lookup tables for the given player count"""
+        key = (self, num_players)
+        compiled = _COMPILED_RULES.get(key)
+        if compiled is None:
+            compiled = _COMPILED_RULES[key] = CompiledRules(self, num_players)
+        return compiled
+
+# Compiled rules shared by every Game using equal rules: (rules, num_players) -> CompiledRules
+_COMPILED_RULES = {}
+
+class CompiledRules:
+    """Precomputed tables and flags derived from a Rules object"""
+
+    def __init__(self, rules, num_players=None):
+        if num_players is None:
+            num_players = len(rules.colors)
+        if not 1 <= num_players <= len(rules.colors):
+            raise ValueError(f"num_players must be between 1 and {len(rules.colors)}")
+
+        self.board_size = rules.board_size
+        self.home_size = rules.home_size
+        self.tokens_per_player = rules.tokens_per_player
+        self.finish_position = HOME_STRETCH_START + rules.home_size - 1
+        self.max_home_offset = rules.home_size - 1
+
+        self.colors = rules.colors[:num_players]
+        self.color_order = list(rules.colors)
+        self.start_positions = dict(rules.start_positions)
+
+        # Home entrance is the square two steps behind a color's start
+        self.home_entrance = {
+            color: (start - 3) % self.board_size + 1
+            for color, start in self.start_positions.items()
+        }
+
+        self.safe_positions = frozenset(rules.safe_positions) | frozenset(rules.extra_safe_positions)
+        self.capturable_positions = frozenset(
+            p for p in range(1, self.board_size + 1) if p not in self.safe_positions
+        )
+
+        self.blockades = rules.blockades
+        self.capture_bonus_roll = rules.capture_bonus_roll
+
+        # move_table[color][position][steps] -> new position
+        self.all_positions = (
+            [HOME_BASE]
+            + list(range(1, self.board_size + 1))
+            + list(range(HOME_STRETCH_START, self.finish_position + 1))
+        )
+        self.move_table = {
+            color: {
+                position: tuple(
+                    self.compute_next_position(position, steps, color)
+                    for steps in range(MAX_DICE_VALUE + 1)
+                )
+                for position in self.all_positions
+            }
+            for color in self.color_order
+        }
+
+    def compute_next_position(self, current_position, steps, color):
+        """Calculate next position after moving steps, without lookup tables"""
+        if current_position == HOME_BASE:
+            if steps == MAX_DICE_VALUE:
+                return self.start_positions[color]
+            return HOME_BASE
+
+        # Home stretch movement
+        if current_position >= HOME_STRETCH_START:
+            new_home_pos = current_position - HOME_STRETCH_START + steps
+            if new_home_pos <= self.max_home_offset:
+                return HOME_STRETCH_START + new_home_pos
+            return current_position  # Invalid move
+
+        # Regular board movement
+        new_position = (current_position + steps - 1) % self.board_size + 1
+
+        # Check if entering home stretch
+        entrance = self.home_entrance[color]
+        if current_position <= entrance < current_position + steps:
+            steps_into_home = steps - (entrance - current_position + 1)
+            if steps_into_home <= self.max_home_offset:
+                return HOME_STRETCH_START + steps_into_home
+            return current_position  # Overshoot, invalid move
+
+        return new_position
+
+CLASSIC_RULES = Rules().compile()
@@ -0,0 +1,197 @@
+"""
+Sweep module - parallel batch evaluation of heuristic policy weights
+
+Each candidate is a weights dict for utils.get_optimal_token_choice. A
+candidate plays one seat against opponents using the default weights, and
+every candidate is scored on the same game seeds (common random numbers),
+so differences in win rate come from the weights rather than the dice.
+Candidates are raced with successive halving: all of them play a small
+batch of games, the weaker ones are dropped, and the survivors play more.
+Usage:
+
+    python -m ludo.sweep --grid leave_home=6,10,14 home_stretch=4,8,12
+    python -m ludo.sweep --random 32 --games 2000 --processes 8
+"""
+
+import argparse
+import itertools
+import math
+import multiprocessing
+import random
+
+from .game import Game
+from .rules import Rules
+from .utils import DEFAULT_HEURISTIC_WEIGHTS, get_optimal_token_choice
+
+# Ranges sampled by random_search: name -> (low, high)
+DEFAULT_SEARCH_RANGES = {
+    'leave_home': (0, 20),
+    'home_stretch': (0, 20),
+    'progress_base': (30, 90),
+    'progress_scale': (1, 20)
+}
+
+def grid(**axes):
+    """Build candidates from every combination of the given weight values"""
+    names = list(axes)
+    candidates = []
+    for values in itertools.product(*(axes[name] for name in names)):
+        weights = dict(DEFAULT_HEURISTIC_WEIGHTS)
+        weights.update(zip(names, values))
+        candidates.append(weights)
+    return candidates
+
+def random_search(num_candidates, ranges=None, seed=0):
+    """Build candidates by sampling weights uniformly from ranges"""
+    if ranges is None:
+        ranges = DEFAULT_SEARCH_RANGES
+    rng = random.Random(seed)
+
+    candidates = []
+    for _ in range(num_candidates):
+        weights = dict(DEFAULT_HEURISTIC_WEIGHTS)
+        for name, (low, high) in ranges.items():
+            weights[name] = rng.uniform(low, high)
+        candidates.append(weights)
+    return candidates
+
+def play_game(weights, seed, num_players=4, rules=None, max_turns=2000):
+    """Play one game with the candidate in seat seed % num_players; True if it wins"""
+    game = Game(num_players, rules, seed)
+    candidate_seat = seed % num_players
+
+    for _ in range(max_turns):
+        if game.game_over:
+            break
+
+        player = game.current_player()
+        dice_value = game.roll_dice()
+        movable = game.get_movable_tokens(player, dice_value)
+
+        token_index = None
+        if movable:
+            seat_weights = weights if game.current_player_index == candidate_seat else None
+            # Score only tokens the game allows, so blocked picks never fall back
+            token_index = get_optimal_token_choice(player, dice_value, game.board, seat_weights, movable)
+        game.play_turn(token_index, dice_value)
+
+    return game.winner is game.players[candidate_seat]
+
+def _evaluate(task):
+    """Worker: count wins for one candidate over a batch of seeds"""
+    index, weights, seeds, num_players, rules, max_turns = task
+    wins = sum(play_game(weights, seed, num_players, rules, max_turns) for seed in seeds)
+    return index, wins, len(seeds)
+
+def validate_search(candidates, eta):
+    """Reject search settings that cannot be raced"""
+    if not candidates:
+        raise ValueError("No candidates to evaluate")
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    for weights in candidates:
+        if weights['progress_scale'] == 0:
+            raise ValueError("progress_scale must be non-zero")
+
+def successive_halving(candidates, games=1000, min_games=None, eta=2, first_seed=0,
+                       num_players=4, rules=None, processes=None, chunk_size=25,
+                       max_turns=2000):
+    """Race candidates, keeping the best 1/eta each round; returns a ranked table
+
+    Every candidate plays min_games games in the first round and survivors
+    play eta times as many in total each following round, up to games. All
+    candidates use the same seeds, first_seed onwards.
+    """
+    validate_search(candidates, eta)
+
+    num_rounds = max(1, math.ceil(math.log(len(candidates), eta))) if len(candidates) > 1 else 1
+    if min_games is None:
+        min_games = max(chunk_size, games // eta ** (num_rounds - 1))
+
+    rows = [
+        {'candidate': i, 'weights': weights, 'games': 0, 'wins': 0, 'win_rate': 0.0, 'round': 0}
+        for i, weights in enumerate(candidates)
+    ]
+    alive = list(range(len(candidates)))
+    target = min(min_games, games)
+
+    with multiprocessing.Pool(processes) as pool:
+        round_number = 0
+        while True:
+            round_number += 1
+
+            # Play each survivor from its last seed up to the round's target
+            tasks = []
+            for i in alive:
+                for start in range(rows[i]['games'], target, chunk_size):
+                    seeds = range(first_seed + start, first_seed + min(start + chunk_size, target))
+                    tasks.append((i, candidates[i], seeds, num_players, rules, max_turns))
+
+            for i, wins, played in pool.imap_unordered(_evaluate, tasks):
+                rows[i]['wins'] += wins
+                rows[i]['games'] += played
+
+            for i in alive:
+                rows[i]['win_rate'] = rows[i]['wins'] / rows[i]['games']
+                rows[i]['round'] = round_number
+
+            if len(alive) <= 1 or target >= games:
+                break
+
+            alive.sort(key=lambda i: rows[i]['win_rate'], reverse=True)
+            alive = alive[:max(1, len(alive) // eta)]
+            target = min(target * eta, games)
+
+    # Candidates that survived longer rank higher, then by win rate
+    return sorted(rows, key=lambda row: (row['round'], row['win_rate']), reverse=True)
+
+def format_table(rows, limit=None):
+    """Format a ranked table as text"""
+    names = list(DEFAULT_HEURISTIC_WEIGHTS)
+    header = ['rank', 'games', 'win_rate'] + names
+    lines = ['  '.join(f"{h:>14}" for h in header)]
+
+    for rank, row in enumerate(rows[:limit], start=1):
+        cells = [str(rank), str(row['games']), f"{row['win_rate']:.3f}"]
+        cells += [f"{row['weights'][name]:.3g}" for name in names]
+        lines.append('  '.join(f"{c:>14}" for c in cells))
+    return '\n'.join(lines)
+
+def _parse_axis(text):
+    name, _, values = text.partition('=')
+    if name not in DEFAULT_HEURISTIC_WEIGHTS:
+        raise argparse.ArgumentTypeError(f"Unknown weight: {name}")
+    return name, [float(v) for v in values.split(',')]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep heuristic weights for get_optimal_token_choice")
+    search = parser.add_mutually_exclusive_group(required=True)
+    search.add_argument('--grid', nargs='+', type=_parse_axis, metavar='NAME=V1,V2,...')
+    search.add_argument('--random', type=int, metavar='N', help="number of random candidates")
+    parser.add_argument('--games', type=int, default=1000, help="games for the final round")
+    parser.add_argument('--eta', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--variant', default='classic')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.grid:
+        candidates = grid(**dict(args.grid))
+    else:
+        candidates = random_search(args.random, seed=args.seed)
+
+    try:
+        validate_search(candidates, args.eta)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    rows = successive_halving(candidates, args.games, eta=args.eta, first_seed=args.seed,
+                              num_players=args.players, rules=Rules.variant(args.variant),
+                              processes=args.processes)
+    print(format_table(rows, args.top))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""
+Sync module - lockstep multiplayer by dice seed and move list
+
+Every client runs its own Game built from the same seed. Only the chosen
+token index for each turn crosses the wire (a 4 byte move message), plus a
+periodic state hash (a 13 byte hash message) to detect divergence. When
+hashes differ, the session rebuilds from the last agreed checkpoint and
+replays the authoritative moves.
+"""
+
+import hashlib
+import struct
+
+from .game import Game
+
+MOVE = 0x01
+HASH = 0x02
+PASS = 0xFF  # Token index sent when the player has no legal move
+
+# type, turn (low 16 bits), token index
+MOVE_MESSAGE = struct.Struct('>BHB')
+# type, turn, state digest
+HASH_MESSAGE = struct.Struct('>BI8s')
+
+MESSAGES = {MOVE: MOVE_MESSAGE, HASH: HASH_MESSAGE}
+
+def encode_move(turn, token_index):
+    """Encode a move for the given turn (token_index None means pass)"""
+    return MOVE_MESSAGE.pack(MOVE, turn & 0xFFFF, PASS if token_index is None else token_index)
+
+def encode_hash(turn, digest):
+    """Encode a state hash for the given turn"""
+    return HASH_MESSAGE.pack(HASH, turn, digest)
+
+def decode_message(data):
+    """Decode a message into (kind, turn, payload)"""
+    if not data:
+        raise ValueError("Empty sync message")
+
+    kind = data[0]
+    message = MESSAGES.get(kind)
+    if message is None:
+        raise ValueError(f"Unknown sync message type: {kind}")
+    if len(data) != message.size:
+        raise ValueError(f"Sync message type {kind} must be {message.size} bytes, got {len(data)}")
+
+    _, turn, payload = message.unpack(data)
+    if kind == MOVE and payload == PASS:
+        payload = None
+    return kind, turn, payload
+
+def state_hash(game):
+    """Get an 8 byte digest of the game state"""
+    state = (
+        game.current_player_index,
+        game.game_over,
+        tuple(tuple(p.get_token_positions()) for p in game.players)
+    )
+    return hashlib.blake2b(repr(state).encode(), digest_size=8).digest()
+
+def snapshot_game(game):
+    """Capture the mutable state of a game, including its dice generator"""
+    return {
+        'rng_state': game.rng.getstate(),
+        'current_player_index': game.current_player_index,
+        'game_over': game.game_over,
+        'winner': game.players.index(game.winner) if game.winner else None,
+        'bonus_roll': game.bonus_roll,
+        'positions': [p.get_token_positions() for p in game.players]
+    }
+
+def restore_game(game, snapshot):
+    """Restore a game to a state captured by snapshot_game"""
+    game.rng.setstate(snapshot['rng_state'])
+    game.current_player_index = snapshot['current_player_index']
+    game.game_over = snapshot['game_over']
+    winner = snapshot['winner']
+    game.winner = game.players[winner] if winner is not None else None
+    game.bonus_roll = snapshot['bonus_roll']
+
+    for player, positions in zip(game.players, snapshot['positions']):
+        for token, position in zip(player.tokens, positions):
+            token.position = position
+        player.update_statistics()
+
+class LockstepSession:
+    def __init__(self, seed, num_players=4, rules=None, checkpoint_interval=16):
+        self.game = Game(num_players, rules, seed)
+        self.checkpoint_interval = checkpoint_interval
+        self.turn = 0
+        self.moves = []          # Token index (or None) for every turn
+        self.dice_value = None   # Dice for the current turn once rolled
+
+        # Local checkpoints awaiting agreement: turn -> (digest, snapshot)
+        self.checkpoints = {}
+        self._record_checkpoint()
+        self._agree(0)
+
+    def roll(self):
+        """Roll (once) the dice for the current turn"""
+        if self.dice_value is None:
+            self.dice_value = self.game.roll_dice()
+        return self.dice_value
+
+    def movable_tokens(self):
+        """Get token indices the current player may move this turn"""
+        return self.game.get_movable_tokens(self.game.current_player(), self.roll())
+
+    def play(self, token_index):
+        """Play a local move and return the message to send to peers"""
+        turn = self.turn
+        self._apply(token_index)
+        return encode_move(turn, token_index)
+
+    def receive(self, data):
+        """Apply a message from a peer; hash messages return whether states agree"""
+        kind, turn, payload = decode_message(data)
+
+        if kind == MOVE:
+            if turn != self.turn & 0xFFFF:
+                raise ValueError(f"Move for turn {turn} received on turn {self.turn}")
+            self._apply(payload)
+            return None
+
+        return self.verify(turn, payload)
+
+    def hash_message(self):
+        """Get the hash message for the most recent local checkpoint"""
+        turn = max(self.checkpoints)
+        return encode_hash(turn, self.checkpoints[turn][0])
+
+    def verify(self, turn, digest):
+        """Compare a peer's digest with ours; matching turns become agreed"""
+        if turn not in self.checkpoints:
+            raise ValueError(f"No local checkpoint for turn {turn}")
+
+        if self.checkpoints[turn][0] != digest:
+            return False
+        self._agree(turn)
+        return True
+
+    def moves_since(self, turn):
+        """Get moves played after the given turn, for a peer to resync"""
+        return self.moves[turn:]
+
+    def resync(self, moves):
+        """Rebuild from the last agreed checkpoint and replay authoritative moves"""
+        restore_game(self.game, self.checkpoints[self.agreed_turn][1])
+        self.turn = self.agreed_turn
+        del self.moves[self.agreed_turn:]
+        self.dice_value = None
+        self.checkpoints = {self.agreed_turn: self.checkpoints[self.agreed_turn]}
+
+        for token_index in moves:
+            self._apply(token_index)
+
+    def _apply(self, token_index):
+        """Play the current turn with the given token choice"""
+        if self.game.game_over:
+            raise ValueError("Game is already over")
+
+        dice_value = self.roll()
+        movable = self.movable_tokens()
+        if token_index is None:
+            if movable:
+                raise ValueError(f"Cannot pass with a {dice_value} on turn {self.turn}: tokens {movable} can move")
+        elif token_index not in movable:
+            raise ValueError(f"Token {token_index} cannot move with a {dice_value} on turn {self.turn}")
+
+        self.game.play_turn(token_index, dice_value)
+        self.moves.append(token_index)
+        self.turn += 1
+        self.dice_value = None
+
+        if self.turn % self.checkpoint_interval == 0:
+            self._record_checkpoint()
+
+    def _record_checkpoint(self):
+        """Store a digest and snapshot of the state at the current turn"""
+        self.checkpoints[self.turn] = (state_hash(self.game), snapshot_game(self.game))
+
+    def _agree(self, turn):
+        """Mark a checkpoint as agreed and drop the older ones"""
+        self.agreed_turn = turn
+        for old_turn in [t for t in self.checkpoints if t < turn]:
+            del self.checkpoints[old_turn]
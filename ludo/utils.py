@@ -4,19 +4,29 @@ Utility functions for the Ludo game
 
 import random
 
-def roll_dice():
+from .rules import CLASSIC_RULES, HOME_BASE, HOME_STRETCH_START, MAX_DICE_VALUE
+
+def roll_dice(rng=None):
     """Roll a six-sided dice and return the result"""
-    return random.randint(1, 6)
+    if rng is None:
+        rng = random
+    return rng.randint(1, MAX_DICE_VALUE)
+
+def _rules_for(board):
+    """Get the compiled rules of a board, or the classic rules"""
+    return board.rules if board is not None else CLASSIC_RULES
 
-def get_safe_positions():
+def get_safe_positions(board=None):
     """Return list of safe positions on the board"""
-    return [1, 9, 14, 22, 27, 35, 40, 48]
+    return sorted(_rules_for(board).safe_positions)
 
-def calculate_position(current_pos, steps, board_size=52):
-    """Calculate new position after moving steps on circular board"""
-    if current_pos == -1:  # In home
-        return -1
+def calculate_position(current_pos, steps, board_size=52, board=None):
+    """Calculate new position after moving steps on circular board (a board's own size if given)"""
+    if current_pos == HOME_BASE:  # In home
+        return HOME_BASE
     
+    if board is not None:
+        board_size = board.rules.board_size
     new_pos = (current_pos + steps - 1) % board_size + 1
     return new_pos
 
@@ -30,41 +40,41 @@ def get_color_emoji(color):
     }
     return color_emojis.get(color, '⚪')
 
-def format_position(position):
+def format_position(position, board=None):
     """Format position for display"""
-    if position == -1:
+    if position == HOME_BASE:
         return "Home"
-    elif position >= 100:
-        return f"Home Stretch {position - 100}"
-    elif position == 105:
+    elif position == _rules_for(board).finish_position:
         return "Finished"
+    elif position >= HOME_STRETCH_START:
+        return f"Home Stretch {position - HOME_STRETCH_START}"
     else:
         return f"Square {position}"
 
 def validate_move(current_pos, dice_value, color, board):
     """Validate if a move is legal"""
-    if current_pos == -1 and dice_value != 6:
+    if current_pos == HOME_BASE and dice_value != MAX_DICE_VALUE:
         return False, "Need 6 to exit home"
     
-    if current_pos >= 100:  # Home stretch
-        home_pos = current_pos - 100
-        if home_pos + dice_value > 5:
+    if current_pos >= HOME_STRETCH_START:  # Home stretch
+        home_pos = current_pos - HOME_STRETCH_START
+        if home_pos + dice_value > board.rules.max_home_offset:
             return False, "Cannot overshoot finish"
     
     return True, "Valid move"
 
 def get_distance_to_finish(position, color, board):
     """Calculate distance from current position to finish"""
-    if position == -1:
-        return 57  # Need to go around entire board + home stretch
-    elif position >= 100:
-        return 105 - position
+    if position == HOME_BASE:
+        return board.BOARD_SIZE + board.HOME_SIZE - 1  # Need to go around entire board + home stretch
+    elif position >= HOME_STRETCH_START:
+        return board.rules.finish_position - position
     else:
         home_entrance = board.home_entrance[color]
         if position <= home_entrance:
-            return (home_entrance - position) + 6
+            return (home_entrance - position) + board.HOME_SIZE
         else:
-            return (52 - position + home_entrance) + 6
+            return (board.BOARD_SIZE - position + home_entrance) + board.HOME_SIZE
 
 def get_game_statistics(players):
     """Generate game statistics"""
@@ -88,27 +98,47 @@ def simulate_dice_probability():
     """Return probability distribution for dice outcomes"""
     return {i: 1/6 for i in range(1, 7)}
 
-def get_optimal_token_choice(player, dice_value, board):
-    """Suggest optimal token to move (basic AI logic)"""
+# Default scores used by get_optimal_token_choice
+DEFAULT_HEURISTIC_WEIGHTS = {
+    'leave_home': 10,      # Getting a token out of home on a 6
+    'home_stretch': 8,     # Advancing a token already in the home stretch
+    'progress_base': 60,   # Board tokens score (progress_base - distance) / progress_scale
+    'progress_scale': 10
+}
+
+def get_optimal_token_choice(player, dice_value, board, weights=None, legal_tokens=None):
+    """Suggest optimal token to move (basic AI logic)
+
+    legal_tokens, if given, limits the choice to those token indices (e.g.
+    from Game.get_movable_tokens, which also accounts for blocking).
+    """
+    if weights is None:
+        weights = DEFAULT_HEURISTIC_WEIGHTS
+    
     movable_tokens = []
     
     for i, token in enumerate(player.tokens):
-        if player.can_move_token(i, dice_value):
+        if legal_tokens is None:
+            legal = player.can_move_token(i, dice_value)
+        else:
+            legal = i in legal_tokens
+        
+        if legal:
             # Calculate priority score
             score = 0
             
             # Prioritize getting tokens out of home
-            if token.is_in_home() and dice_value == 6:
-                score += 10
+            if token.is_in_home() and dice_value == MAX_DICE_VALUE:
+                score += weights['leave_home']
             
             # Prioritize finishing tokens
             elif token.is_in_home_stretch():
-                score += 8
+                score += weights['home_stretch']
             
             # Prioritize tokens closer to finish
             elif token.is_in_play():
                 distance = get_distance_to_finish(token.position, player.color, board)
-                score += (60 - distance) / 10
+                score += (weights['progress_base'] - distance) / weights['progress_scale']
             
             movable_tokens.append((i, score))
     
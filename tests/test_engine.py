@@ -0,0 +1,122 @@
+"""
+Tests for the Flappy Bird engines - both must follow the original scalar physics
+"""
+
+import random
+import sys
+
+import pytest
+
+import flappy
+from flappy.engine import (
+    BIRD_SIZE, BIRD_X, GAME_HEIGHT, GAME_WIDTH, GRAVITY, JUMP_STRENGTH, PIPE_GAP,
+    PIPE_SPEED, PIPE_WIDTH, FlappyEngine
+)
+
+def reference_run(seed, policy, max_frames=3000):
+    """The original per-frame physics, with a list of pipe dicts"""
+    rng = random.Random(seed)
+    bird_y, velocity, pipes, score, frames = GAME_HEIGHT // 2, 0, [], 0, 0
+    game_over = False
+
+    while not game_over and frames < max_frames:
+        if policy(bird_y, velocity, [(p['x'], p['gap_y']) for p in pipes]):
+            velocity = JUMP_STRENGTH
+        velocity += GRAVITY
+        bird_y += velocity
+        if bird_y < BIRD_SIZE:
+            bird_y, game_over = BIRD_SIZE, True
+        elif bird_y > GAME_HEIGHT - BIRD_SIZE - 50:
+            bird_y, game_over = GAME_HEIGHT - BIRD_SIZE - 50, True
+
+        for pipe in pipes:
+            pipe['x'] -= PIPE_SPEED
+        pipes = [pipe for pipe in pipes if pipe['x'] > -PIPE_WIDTH]
+        if not pipes or pipes[-1]['x'] < GAME_WIDTH - 250:
+            pipes.append({'x': GAME_WIDTH, 'gap_y': rng.randint(150, GAME_HEIGHT - PIPE_GAP - 150),
+                          'passed': False})
+
+        bird_left, bird_right = BIRD_X - BIRD_SIZE // 2, BIRD_X + BIRD_SIZE // 2
+        bird_top, bird_bottom = bird_y - BIRD_SIZE // 2, bird_y + BIRD_SIZE // 2
+        for pipe in pipes:
+            if bird_right > pipe['x'] and bird_left < pipe['x'] + PIPE_WIDTH:
+                if bird_top < pipe['gap_y'] or bird_bottom > pipe['gap_y'] + PIPE_GAP:
+                    game_over = True
+                    break
+            if pipe['x'] + PIPE_WIDTH < BIRD_X and not pipe['passed']:
+                pipe['passed'] = True
+                score += 1
+        frames += 1
+
+    return frames, score, bird_y
+
+def steering_policy(offset=0):
+    """Flap when the bird is heading below the middle of the next gap"""
+    def policy(bird_y, velocity, pipes):
+        target = GAME_HEIGHT / 2
+        for x, gap_y in pipes:
+            if x + PIPE_WIDTH > BIRD_X - BIRD_SIZE // 2:
+                target = gap_y + PIPE_GAP / 2
+                break
+        return bird_y + 2 * velocity > target + 65 + offset
+    return policy
+
+def engine_run(seed, policy, max_frames=3000):
+    engine = FlappyEngine(seed)
+    while not engine.game_over and engine.frame < max_frames:
+        engine.step(policy(engine.bird_y, engine.bird_velocity, list(engine.pipe_stream.ring)))
+    return engine
+
+@pytest.mark.parametrize('offset', [-15, -5, 5])
+def test_engine_matches_reference_physics(offset):
+    policy = steering_policy(offset)
+    total_score = 0
+    for seed in range(30):
+        engine = engine_run(seed, policy)
+        assert (engine.frame, engine.score, engine.bird_y) == reference_run(seed, policy)
+        total_score += engine.score
+    assert total_score > 0  # The comparison must cover scoring, not only crashes
+
+def test_engine_records_flaps():
+    engine = engine_run(3, steering_policy())
+    recording = engine.recording()
+    assert recording['frames'] == engine.frame
+    assert recording['flaps'] == sorted(set(recording['flaps']))
+
+def test_batch_is_imported_lazily():
+    pytest.importorskip("numpy")
+    # Start unloaded, so the attribute goes through the package __getattr__
+    vars(flappy).pop("batch", None)
+    sys.modules.pop("flappy.batch", None)
+
+    assert flappy.batch is sys.modules["flappy.batch"]
+    assert "batch" in vars(flappy)  # Cached, so __getattr__ is not hit again
+    with pytest.raises(AttributeError):
+        flappy.missing
+
+def test_batch_engine_matches_scalar_engine():
+    np = pytest.importorskip("numpy")
+    BatchEngine = flappy.batch.BatchEngine  # Through the package's lazy attribute
+
+    offsets = [-40, -15, -5, 0, 5, 30]
+    batch = BatchEngine(len(offsets), seed=7)
+
+    def controller(bird_y, velocity, pipe_dx, gap_y):
+        return np.array([
+            steering_policy(offset)(y, v, [(BIRD_X + pipe_dx, gap_y)])
+            for offset, y, v in zip(offsets, bird_y, velocity)
+        ])
+
+    scores = batch.run(controller, max_frames=3000)
+
+    for i, offset in enumerate(offsets):
+        engine = FlappyEngine(7)
+        policy = steering_policy(offset)
+        while not engine.game_over and engine.frame < 3000:
+            pipe = engine.pipe_stream.nearest()
+            pipes = [pipe] if pipe is not None else []
+            engine.step(policy(engine.bird_y, engine.bird_velocity, pipes))
+
+        assert scores[i] == engine.score
+        assert batch.frames_alive[i] == engine.frame
+        assert batch.bird_y[i] == engine.bird_y
@@ -0,0 +1,84 @@
+"""
+Tests for replay verification and the leaderboard that relies on it
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from flappy.engine import GAME_HEIGHT, PIPE_GAP, FlappyEngine
+from flappy.leaderboard import Leaderboard
+from flappy.replay import resimulate, verify_run
+
+def play(seed, max_frames=2000):
+    """Play a scoring run by steering towards the middle of the next gap"""
+    engine = FlappyEngine(seed)
+    while not engine.game_over and engine.frame < max_frames:
+        pipe = engine.pipe_stream.nearest()
+        target = pipe[1] + PIPE_GAP / 2 if pipe is not None else GAME_HEIGHT / 2
+        engine.step(engine.bird_y + 2 * engine.bird_velocity > target + 65)
+    return engine
+
+@pytest.fixture(scope='module')
+def run():
+    engine = play(12)
+    assert engine.game_over and engine.score > 0
+    return engine.recording()
+
+def test_true_score_is_accepted(run):
+    assert verify_run(run['seed'], run['flaps'], run['score'])
+
+def test_inflated_score_is_rejected(run):
+    assert not verify_run(run['seed'], run['flaps'], run['score'] + 1)
+
+def test_resimulation_reproduces_the_run(run):
+    engine = resimulate(run['seed'], run['flaps'])
+    assert (engine.frame, engine.score) == (run['frames'], run['score'])
+
+def test_malformed_recordings_are_rejected(run):
+    flaps = run['flaps']
+    assert not verify_run(run['seed'], flaps[::-1], run['score'])
+    assert not verify_run(run['seed'], flaps + [run['frames'] + 10], run['score'])
+    assert not verify_run(run['seed'], flaps, run['score'], max_frames=run['frames'] - 1)
+
+def test_leaderboard_serves_queued_scores(tmp_path, run):
+    path = str(tmp_path / "scores.db")
+    leaderboard = Leaderboard(path, batch_size=8, flush_seconds=60)
+    assert leaderboard.submit("alice", run['seed'], run['flaps'], run['score'])
+    assert not leaderboard.submit("mallory", run['seed'], run['flaps'], run['score'] + 1)
+
+    # Reading does not write the batch, but still sees the queued score
+    assert [row[:2] for row in leaderboard.top(5)] == [("alice", run['score'])]
+    assert len(leaderboard.pending) == 1
+
+    leaderboard.close()
+    reopened = Leaderboard(path)
+    assert [row[:2] for row in reopened.top(5)] == [("alice", run['score'])]
+    reopened.close()
+
+def test_leaderboard_writes_a_lone_score_once_it_is_old(tmp_path, run):
+    path = str(tmp_path / "scores.db")
+    leaderboard = Leaderboard(path, batch_size=8, flush_seconds=0.05)
+    assert leaderboard.submit("alice", run['seed'], run['flaps'], run['score'])
+
+    # No further submits or reads: the age timer alone writes the batch
+    rows = []
+    deadline = time.monotonic() + 5
+    with sqlite3.connect(path) as connection:
+        while not rows and time.monotonic() < deadline:
+            time.sleep(0.01)
+            rows = connection.execute("SELECT player, score FROM scores").fetchall()
+    assert rows == [("alice", run['score'])]
+    assert leaderboard.pending == []
+    leaderboard.close()
+
+def test_leaderboard_writes_full_batches(tmp_path, run):
+    path = str(tmp_path / "scores.db")
+    leaderboard = Leaderboard(path, batch_size=2, flush_seconds=60)
+    for player in ("alice", "bob"):
+        assert leaderboard.submit(player, run['seed'], run['flaps'], run['score'])
+    assert leaderboard.pending == [] and leaderboard.flush_timer is None
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM scores").fetchone() == (2,)
+    leaderboard.close()
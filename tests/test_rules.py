@@ -0,0 +1,213 @@
+"""
+Tests for the compiled rules - the classic Game must keep the baseline move
+rules, and each house rule must change only what it describes
+"""
+
+import random
+
+import pytest
+
+from ludo import Board, Game, Rules, calculate_position
+from ludo.rules import CLASSIC_RULES
+
+BASELINE_START = {'red': 1, 'blue': 14, 'yellow': 27, 'green': 40}
+BASELINE_ENTRANCE = {'red': 51, 'blue': 12, 'yellow': 25, 'green': 38}
+BASELINE_SAFE = {1, 9, 14, 22, 27, 35, 40, 48}
+ALL_POSITIONS = [-1] + list(range(1, 53)) + list(range(100, 106))
+
+def baseline_next_position(current_position, steps, color):
+    """The move rule of the original hard-coded Board"""
+    if current_position == -1:
+        return BASELINE_START[color] if steps == 6 else -1
+
+    if current_position >= 100:
+        new_home_pos = current_position - 100 + steps
+        return 100 + new_home_pos if new_home_pos <= 5 else current_position
+
+    new_position = (current_position + steps - 1) % 52 + 1
+    entrance = BASELINE_ENTRANCE[color]
+    if current_position <= entrance < current_position + steps:
+        steps_into_home = steps - (entrance - current_position + 1)
+        return 100 + steps_into_home if steps_into_home <= 5 else current_position
+    return new_position
+
+def baseline_can_capture(position, attacking_color, defending_color):
+    """The capture rule of the original hard-coded Board"""
+    return (position not in BASELINE_SAFE and attacking_color != defending_color
+            and position < 100)
+
+class BaselineGame:
+    """Original Game turn logic, driven by the same dice and choices"""
+
+    def __init__(self, num_players):
+        self.colors = ['red', 'blue', 'yellow', 'green'][:num_players]
+        self.positions = [[-1] * 4 for _ in self.colors]
+
+    def movable_tokens(self, seat, dice_value):
+        color = self.colors[seat]
+        tokens = self.positions[seat]
+        movable = []
+        for i, position in enumerate(tokens):
+            new_position = baseline_next_position(position, dice_value, color)
+            if new_position == position:
+                continue
+            if new_position < 100 and new_position in tokens:
+                continue
+            movable.append(i)
+        return movable
+
+    def move(self, seat, token_index, dice_value):
+        color = self.colors[seat]
+        new_position = baseline_next_position(self.positions[seat][token_index], dice_value, color)
+        for other_seat, tokens in enumerate(self.positions):
+            if other_seat == seat:
+                continue
+            for i, position in enumerate(tokens):
+                if position == new_position and baseline_can_capture(position, color, self.colors[other_seat]):
+                    tokens[i] = -1
+        self.positions[seat][token_index] = new_position
+
+@pytest.mark.parametrize('color', ['red', 'blue', 'yellow', 'green'])
+def test_move_table_matches_baseline(color):
+    board = Board()
+    for position in ALL_POSITIONS:
+        for steps in range(1, 7):
+            assert board.get_next_position(position, steps, color) == \
+                baseline_next_position(position, steps, color), (position, steps)
+
+def test_capture_rule_matches_baseline():
+    board = Board()
+    for position in ALL_POSITIONS[1:]:
+        for attacker in BASELINE_START:
+            for defender in BASELINE_START:
+                assert board.can_capture(position, attacker, defender) == \
+                    baseline_can_capture(position, attacker, defender), (position, attacker, defender)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_classic_game_matches_baseline(seed):
+    rng = random.Random(seed)
+    num_players = 2 + seed % 3
+    game = Game(num_players)
+    baseline = BaselineGame(num_players)
+
+    for _ in range(3000):
+        if game.game_over:
+            break
+        seat = game.current_player_index
+        dice_value = rng.randint(1, 6)
+        movable = game.get_movable_tokens(game.current_player(), dice_value)
+        assert movable == baseline.movable_tokens(seat, dice_value)
+
+        token_index = rng.choice(movable) if movable else None
+        game.play_turn(token_index, dice_value)
+        if token_index is not None:
+            baseline.move(seat, token_index, dice_value)
+        assert [p.get_token_positions() for p in game.players] == baseline.positions
+
+    assert game.game_over
+    assert all(p == 105 for p in game.winner.get_token_positions())
+
+def test_rules_are_frozen_and_hashable():
+    rules = Rules()
+    with pytest.raises(AttributeError):
+        rules.board_size = 40
+    assert rules == Rules()
+    assert hash(rules) == hash(Rules())
+    assert rules != Rules.variant('quick')
+
+def test_compiled_rules_are_cached():
+    assert Rules().compile() is CLASSIC_RULES
+    assert Rules().compile(2) is Rules().compile(2)
+    assert Rules().compile(2) is not CLASSIC_RULES
+    assert Game(2).board.move_table is Game(2).board.move_table
+
+def test_calculate_position_keeps_board_size_argument():
+    assert calculate_position(50, 5, 52) == 3
+    assert calculate_position(50, 5, board_size=52) == 3
+    assert calculate_position(38, 5, board=Board(Rules(board_size=40).compile())) == 3
+    assert calculate_position(-1, 6) == -1
+
+def test_default_safe_squares_follow_the_board():
+    assert set(Rules().compile().safe_positions) == BASELINE_SAFE
+    rules = Rules(board_size=40)
+    starts = {start for _, start in rules.start_positions}
+    assert starts == {1, 11, 21, 31}
+    assert starts <= set(rules.safe_positions)
+    assert all(1 <= square <= 40 for square in rules.safe_positions)
+
+@pytest.mark.parametrize('options', [
+    {'board_size': 40, 'safe_positions': (1, 48)},
+    {'extra_safe_positions': (0,)},
+    {'start_positions': {'red': 1, 'blue': 60, 'yellow': 27, 'green': 40}},
+])
+def test_squares_off_the_track_are_rejected(options):
+    with pytest.raises(ValueError):
+        Rules(**options)
+
+def place(game, *positions):
+    """Put each seat's tokens on the given squares"""
+    for player, seat_positions in zip(game.players, positions):
+        for token, position in zip(player.tokens, seat_positions):
+            token.position = position
+        player.update_statistics()
+
+def test_blockade_cannot_be_landed_on_or_passed():
+    game = Game(2, Rules.variant('blockade'))
+    place(game, [3, 6, -1, -1], [5, 5, -1, -1])
+    red = game.players[0]
+    assert game.get_movable_tokens(red, 2) == [1]  # Token 0 would land on the blockade
+    assert game.get_movable_tokens(red, 4) == [1]  # Token 0 would pass it
+
+    # A single opposing token neither blocks nor stops a pass
+    place(game, [3, 6, -1, -1], [5, 7, -1, -1])
+    assert game.get_movable_tokens(red, 4) == [0, 1]
+
+def test_blockade_variant_allows_stacking_own_tokens():
+    classic = Game(2)
+    blockade = Game(2, Rules.variant('blockade'))
+    place(classic, [3, 4, -1, -1], [-1] * 4)
+    place(blockade, [3, 4, -1, -1], [-1] * 4)
+    assert classic.get_movable_tokens(classic.players[0], 1) == [1]
+    assert blockade.get_movable_tokens(blockade.players[0], 1) == [0, 1]
+
+@pytest.mark.parametrize('variant, keeps_turn', [('capture_bonus', True), ('classic', False)])
+def test_capture_bonus_roll_keeps_the_turn(variant, keeps_turn):
+    game = Game(2, Rules.variant(variant))
+    place(game, [3, -1, -1, -1], [5, -1, -1, -1])
+    game.play_turn(0, 2)
+    assert game.players[1].tokens[0].position == -1  # Captured
+    assert game.bonus_roll is keeps_turn
+    assert game.current_player_index == (0 if keeps_turn else 1)
+
+    # A move without a capture passes the turn as usual
+    place(game, [3, -1, -1, -1], [-1] * 4)
+    game.current_player_index = 0
+    game.play_turn(0, 2)
+    assert not game.bonus_roll
+    assert game.current_player_index == 1
+
+def test_quick_variant_wins_with_two_tokens():
+    game = Game(2, Rules.variant('quick'))
+    red = game.players[0]
+    assert len(red.tokens) == 2
+    place(game, [105, 104], [-1, -1])
+    game.play_turn(1, 1)
+    assert game.game_over and game.winner is red
+
+    classic = Game(2)
+    place(classic, [105, 104, -1, -1], [-1] * 4)
+    classic.play_turn(1, 1)
+    assert not classic.game_over
+
+def test_extra_safe_positions_prevent_capture():
+    game = Game(2, Rules(extra_safe_positions=(5,)))
+    assert game.board.is_safe_position(5)
+    place(game, [3, -1, -1, -1], [5, -1, -1, -1])
+    game.play_turn(0, 2)
+    assert game.players[0].tokens[0].position == 5
+    assert game.players[1].tokens[0].position == 5  # Not captured
+
+    classic = Game(2)
+    place(classic, [3, -1, -1, -1], [5, -1, -1, -1])
+    classic.play_turn(0, 2)
+    assert classic.players[1].tokens[0].position == -1
@@ -0,0 +1,90 @@
+"""
+Tests for lockstep sync - sessions on one seed stay in step from move messages alone
+"""
+
+import random
+
+import pytest
+
+from ludo.sync import (
+    HASH_MESSAGE, MOVE, MOVE_MESSAGE, LockstepSession, decode_message, encode_hash,
+    encode_move, state_hash
+)
+
+def choose(session, rng):
+    movable = session.movable_tokens()
+    return rng.choice(movable) if movable else None
+
+def test_two_sessions_stay_in_sync():
+    host, peer = LockstepSession(42), LockstepSession(42)
+    rng = random.Random(0)
+
+    while not host.game.game_over and host.turn < 400:
+        assert host.movable_tokens() == peer.movable_tokens()
+        message = host.play(choose(host, rng))
+        assert len(message) == MOVE_MESSAGE.size
+        assert peer.receive(message) is None
+
+        if host.turn % host.checkpoint_interval == 0:
+            hash_message = host.hash_message()
+            assert len(hash_message) == HASH_MESSAGE.size
+            assert peer.receive(hash_message) is True
+            assert peer.agreed_turn == host.turn
+
+    assert peer.turn == host.turn
+    assert state_hash(peer.game) == state_hash(host.game)
+
+def test_disagreement_is_repaired_by_resync():
+    host, peer = LockstepSession(7), LockstepSession(7)
+
+    # Same dice, different choices: the peer drifts from the host
+    for _ in range(host.checkpoint_interval):
+        host.play(min(host.movable_tokens(), default=None))
+        peer.play(max(peer.movable_tokens(), default=None))
+    assert state_hash(peer.game) != state_hash(host.game)
+
+    assert peer.receive(host.hash_message()) is False
+    assert peer.agreed_turn == 0
+
+    peer.resync(host.moves_since(peer.agreed_turn))
+    assert peer.turn == host.turn
+    assert state_hash(peer.game) == state_hash(host.game)
+    assert peer.receive(host.hash_message()) is True
+    assert peer.agreed_turn == host.turn
+
+@pytest.mark.parametrize('data', [
+    b"",
+    b"\x09\x00\x00\x00",                       # Unknown type
+    encode_move(0, 1)[:-1],                    # Truncated move
+    encode_move(0, 1) + b"\x00",               # Oversized move
+    encode_hash(16, b"\x00" * 8)[:-2],         # Truncated hash
+])
+def test_malformed_messages_are_rejected(data):
+    with pytest.raises(ValueError):
+        decode_message(data)
+
+def test_messages_round_trip():
+    assert decode_message(encode_move(70000, 2)) == (MOVE, 70000 & 0xFFFF, 2)
+    assert decode_message(encode_move(3, None)) == (MOVE, 3, None)
+
+def test_moves_that_break_the_rules_are_rejected():
+    session = LockstepSession(3)
+
+    # Play on until some, but not all, of the current player's tokens can move
+    num_tokens = len(session.game.current_player().tokens)
+    while not 0 < len(session.movable_tokens()) < num_tokens:
+        session.receive(encode_move(session.turn, min(session.movable_tokens(), default=None)))
+    movable = session.movable_tokens()
+    turn = session.turn
+
+    with pytest.raises(ValueError):
+        session.receive(encode_move(turn, None))  # Passing with a legal move
+    illegal = next(i for i in range(num_tokens) if i not in movable)
+    with pytest.raises(ValueError):
+        session.receive(encode_move(turn, illegal))
+    with pytest.raises(ValueError):
+        session.receive(encode_move(turn + 1, movable[0]))  # Wrong turn
+    assert session.turn == turn
+
+    session.receive(encode_move(turn, movable[0]))
+    assert session.turn == turn + 1